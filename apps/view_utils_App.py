@@ -33,112 +33,351 @@ Notes:
       - UY: triangle in XZ-plane
       - UZ: triangle in XY-plane
     * Rotational (RX/RY/RZ): **'x' symbols** (two short crossing line segments) in the plane perpendicular to the rotation axis.
+    * All glyphs share one trace, colored per DOF; legend entries are empty proxies.
 - Spring markers overlay:
     * Rendered as **diamond symbols** (symbol='diamond') in orange color
     * Marks structural nodes that have zeroLength spring elements attached
     * Springs model soil-structure interaction (e.g., pile p-y springs)
-- No external deps beyond Plotly.
+- Plotly is the only hard dependency; NumPy (vectorized paths) and numba
+  (large-model polyline packing) are used when installed.
+- Traces are assembled as plain dict specs and the Figure is built once with
+  validation disabled; graph_objs constructors validate and deep-copy every
+  property, which dominated redraw time in the Streamlit viewer.
+- Each overlay's finished traces are cached on the inputs it depends on, so
+  view-only toggles (axes, grid, show_* flags) just re-assemble the Figure.
 """
 
 from __future__ import annotations
-from typing import Dict, Tuple, Any, List, Iterable, Optional, Set
+from typing import Dict, Tuple, Any, List, Iterable, Optional, Sequence, Set
 import math
+import statistics
+import threading
+from collections import OrderedDict, defaultdict
 from plotly import graph_objects as go
 
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
 Vec3 = Tuple[float, float, float]
 
+# Hover labels are formatted by Plotly.js on demand from per-point customdata
+# instead of pre-rendering one string per node/element in Python.
+_ELEMENT_HOVER = ("<b>Element</b> %{customdata[0]}<br>nI=%{customdata[1]} → nJ=%{customdata[2]}"
+                  "<br>Δx=%{customdata[3]:.3f}, Δy=%{customdata[4]:.3f}, Δz=%{customdata[5]:.3f}"
+                  "<extra></extra>")
+_NODE_HOVER = ("<b>Node</b> %{customdata[0]}"
+               "<br>x=%{customdata[1]:.3f}, y=%{customdata[2]:.3f}, z=%{customdata[3]:.3f}"
+               "<extra></extra>")
+
 # Fallback EPS if config is absent
 try:
     from config import EPS  # shared project tolerance
 except Exception:
     EPS = 1e-9
 
+# Below this many elements the per-element Python loop beats array setup.
+_NUMPY_MIN_EDGES = 256
+_NUMPY_MIN_SUPPORTS = 64
+_NUMPY_MIN_NODES = 256
+# Node marker cap per figure; beyond it the marker trace is decimated.
+_MAX_NODE_MARKERS = 50_000
+# Large-model mode: JIT-packed polylines skip the mask/stack temporaries.
+_NUMBA_MIN_EDGES = 50_000
+
+# Derived geometry keyed on a content snapshot of nodes/elements. Streamlit
+# reruns the whole script on every widget change while the model is the same.
+_GEOM_CACHE: "OrderedDict[Tuple[Any, ...], Any]" = OrderedDict()
+_GEOM_CACHE_MAX = 16
+# Streamlit runs sessions on separate threads that share this module
+_GEOM_CACHE_LOCK = threading.Lock()
+
+
+class _Snapshot:
+    """Content snapshot of a mapping with its hash computed once."""
+    __slots__ = ("items", "_hash")
+
+    def __init__(self, items: Tuple[Any, ...]):
+        self.items = items
+        self._hash = hash(items)
+
+    def __hash__(self) -> int:
+        return self._hash
+
+    def __eq__(self, other: object) -> bool:
+        return (isinstance(other, _Snapshot) and self._hash == other._hash
+                and self.items == other.items)
+
+
+def _content_key(d: Dict[Any, Any]) -> Optional[_Snapshot]:
+    """Hashable snapshot of a mapping, or None if its values are unhashable."""
+    try:
+        return _Snapshot(tuple(d.items()))
+    except TypeError:
+        return None
+
+
+def _memo(key: Optional[Tuple[Any, ...]], build):
+    """Return the cached value for key, building (and caching) it on a miss."""
+    if key is None:
+        return build()
+    with _GEOM_CACHE_LOCK:
+        hit = _GEOM_CACHE.get(key)
+        if hit is not None:
+            _GEOM_CACHE.move_to_end(key)
+            return hit
+    # Built outside the lock: builders may call _memo for shared inputs
+    val = build()
+    with _GEOM_CACHE_LOCK:
+        _GEOM_CACHE[key] = val
+        while len(_GEOM_CACHE) > _GEOM_CACHE_MAX:
+            _GEOM_CACHE.popitem(last=False)
+    return val
+
 
 def _axis_ranges(nodes: Dict[int, Vec3], pad_ratio: float = 0.05) -> Tuple[Tuple[float,float], Tuple[float,float], Tuple[float,float]]:
     if not nodes:
         return (0.0, 1.0), (0.0, 1.0), (0.0, 1.0)
-    xs, ys, zs = zip(*[nodes[n] for n in nodes])
     def pad(lo, hi):
         span = max(hi - lo, 1.0)
         p = span * pad_ratio
         return lo - p, hi + p
+    if NUMPY_AVAILABLE and len(nodes) >= _NUMPY_MIN_NODES:
+        # Stream coordinates straight into one (N,3) buffer; no N-tuple copies
+        arr = np.fromiter((v for p in nodes.values() for v in p[:3]),
+                          dtype=np.float64, count=3 * len(nodes)).reshape(-1, 3)
+        lo = arr.min(axis=0).tolist()
+        hi = arr.max(axis=0).tolist()
+        return pad(lo[0], hi[0]), pad(lo[1], hi[1]), pad(lo[2], hi[2])
+    xs, ys, zs = zip(*nodes.values())
     return pad(min(xs), max(xs)), pad(min(ys), max(ys)), pad(min(zs), max(zs))
 
 
-def _dominant_axis(p1: Vec3, p2: Vec3) -> str:
-    dx = abs(p2[0] - p1[0])
-    dy = abs(p2[1] - p1[1])
-    dz = abs(p2[2] - p1[2])
-    m = max(dx, dy, dz)
-    if m <= EPS:
-        return "other"
-    if m == dz: return "Z"
-    if m == dx: return "X"
-    if m == dy: return "Y"
-    return "other"
+def _build_edge_soa(
+    nodes: Dict[int, Vec3],
+    elements: Dict[int, Tuple[int, int]],
+):
+    """
+    Gather every element whose end nodes exist into structure-of-arrays form.
+    Returns (keep, p1, p2, d, L, is_col) or None if no element qualifies:
+        keep   : List[(etag, ni, nj)] in element insertion order
+        p1, p2 : (E,3) end coordinates; d = p2 - p1; L : (E,) lengths
+        is_col : (E,) bool, Z is the dominant axis (Z wins ties; edges
+                 shorter than EPS on every axis are not columns)
+    Shared by the polyline and local-axes builders so the element set is
+    walked once per geometry.
+    """
+    row = {t: k for k, t in enumerate(nodes)}
+    keep = [(etag, ni, nj) for etag, (ni, nj) in elements.items()
+            if ni in row and nj in row]
+    if not keep:
+        return None
+
+    xyz = np.array(list(nodes.values()), dtype=np.float64).reshape(-1, 3)
+    ii = np.fromiter((row[ni] for _, ni, _ in keep), dtype=np.int64, count=len(keep))
+    jj = np.fromiter((row[nj] for _, _, nj in keep), dtype=np.int64, count=len(keep))
+    p1 = xyz[ii]
+    p2 = xyz[jj]
+    d = p2 - p1
+    a = np.abs(d)
+    is_col = (a[:, 2] > EPS) & (a[:, 2] >= a[:, 0]) & (a[:, 2] >= a[:, 1])
+    L = np.sqrt((d * d).sum(axis=1))
+    return keep, p1, p2, d, L, is_col
+
+
+def _use_edge_soa(elements: Dict[int, Tuple[int, int]]) -> bool:
+    return NUMPY_AVAILABLE and len(elements) >= _NUMPY_MIN_EDGES
 
 
 def _segment_lists(
     nodes: Dict[int, Vec3],
     elements: Dict[int, Tuple[int, int]],
-) -> Tuple[List[float], List[float], List[float], List[str], List[str],
-           List[float], List[float], List[float], List[str], List[str]]:
+    soa=None,
+    build_hover: bool = True,
+) -> Tuple[Sequence[float], Sequence[float], Sequence[float], Any,
+           Sequence[float], Sequence[float], Sequence[float], Any]:
     """
     Build two polyline traces (beams vs columns) by separating with None breaks.
     Returns:
-        beams_x, beams_y, beams_z, beams_text, beams_hover,
-        cols_x,  cols_y,  cols_z, cols_text,  cols_hover
+        beams_x, beams_y, beams_z, beams_cd,
+        cols_x,  cols_y,  cols_z, cols_cd
+    where *_cd is per-vertex customdata [etag, ni, nj, dx, dy, dz] for
+    _ELEMENT_HOVER, or None when build_hover is False. The NumPy path
+    returns arrays (NaN breaks) throughout. Pass a prebuilt _build_edge_soa
+    result as 'soa' to reuse it.
     """
+    if soa is None and _use_edge_soa(elements):
+        soa = _build_edge_soa(nodes, elements)
+        if soa is None:
+            return [], [], [], None, [], [], [], None
+    if soa is not None:
+        return _segment_lists_soa(soa, build_hover)
+
     beams_x: List[float]; beams_y: List[float]; beams_z: List[float]
-    beams_x, beams_y, beams_z, beams_text, beams_hover = [], [], [], [], []
+    beams_x, beams_y, beams_z, beams_cd = [], [], [], []
     cols_x: List[float]; cols_y: List[float]; cols_z: List[float]
-    cols_x, cols_y, cols_z, cols_text, cols_hover = [], [], [], [], []
+    cols_x, cols_y, cols_z, cols_cd = [], [], [], []
 
-    for etag in sorted(elements.keys()):
-        ni, nj = elements[etag]
+    # Insertion order is deterministic; Plotly draws by trace, not by index
+    for etag, (ni, nj) in elements.items():
         if ni not in nodes or nj not in nodes:
             continue
         p1, p2 = nodes[ni], nodes[nj]
-        dom = _dominant_axis(p1, p2)
+        dz = abs(p2[2] - p1[2])
+        # Column when Z dominates (ties go to Z) and the edge isn't degenerate
+        is_col = dz > EPS and dz >= abs(p2[0] - p1[0]) and dz >= abs(p2[1] - p1[1])
         xseq = [p1[0], p2[0], None]
         yseq = [p1[1], p2[1], None]
         zseq = [p1[2], p2[2], None]
-        txt  = f"Ele {etag} | nI={ni}, nJ={nj}"
-        hov  = (f"<b>Element</b> {etag}<br>nI={ni} → nJ={nj}"
-                f"<br>Δx={p2[0]-p1[0]:.3f}, Δy={p2[1]-p1[1]:.3f}, Δz={p2[2]-p1[2]:.3f}")
-        if dom == "Z":
+        if is_col:
             cols_x += xseq; cols_y += yseq; cols_z += zseq
-            cols_text += [txt, "", ""]
-            cols_hover += [hov, "", ""]
         else:
             beams_x += xseq; beams_y += yseq; beams_z += zseq
-            beams_text += [txt, "", ""]
-            beams_hover += [hov, "", ""]
+        if build_hover:
+            cd = [etag, ni, nj, p2[0]-p1[0], p2[1]-p1[1], p2[2]-p1[2]]
+            (cols_cd if is_col else beams_cd).extend((cd, cd, cd))
 
-    return beams_x, beams_y, beams_z, beams_text, beams_hover, cols_x, cols_y, cols_z, cols_text, cols_hover
+    if not build_hover:
+        return beams_x, beams_y, beams_z, None, cols_x, cols_y, cols_z, None
+    return beams_x, beams_y, beams_z, beams_cd, cols_x, cols_y, cols_z, cols_cd
 
 
-def _median(vals: List[float]) -> float:
-    if not vals:
-        return 0.0
-    s = sorted(vals)
-    n = len(s)
-    m = n // 2
-    return (s[m] if n % 2 == 1 else 0.5 * (s[m-1] + s[m]))
+def _xyz_columns(pts):
+    """
+    Split (n,3) points into x/y/z arrays. They are handed to Plotly as-is:
+    NumPy arrays serialize as base64 typed arrays (plus orjson when it is
+    installed), a fraction of the size of JSON float text.
+    """
+    return pts[:, 0], pts[:, 1], pts[:, 2]
+
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True, nogil=True)
+    def _pack_polylines_numba(p1, p2, is_col, out_beam, out_col):
+        """
+        Write [p1, p2, NaN] row triples for every edge into the beam or
+        column buffer (preallocated to 3 rows per edge) in one pass.
+        """
+        b = 0
+        c = 0
+        for e in range(p1.shape[0]):
+            if is_col[e]:
+                out = out_col
+                k = c
+                c += 3
+            else:
+                out = out_beam
+                k = b
+                b += 3
+            for m in range(3):
+                out[k, m] = p1[e, m]
+                out[k + 1, m] = p2[e, m]
+                out[k + 2, m] = np.nan
+
+
+def _segment_lists_soa(soa, build_hover: bool = True):
+    """
+    NumPy variant of _segment_lists over _build_edge_soa arrays: splits by
+    the column mask and interleaves [p1, p2, NaN] rows. NaN breaks render
+    like None in Plotly.
+    """
+    keep, p1, p2, d, _, is_col = soa
+
+    is_beam = ~is_col
+    if NUMBA_AVAILABLE and len(keep) >= _NUMBA_MIN_EDGES:
+        n_col = int(is_col.sum())
+        beam_pts = np.empty((3 * (len(keep) - n_col), 3), dtype=np.float64)
+        col_pts = np.empty((3 * n_col, 3), dtype=np.float64)
+        _pack_polylines_numba(p1, p2, is_col, beam_pts, col_pts)
+    else:
+        def _interleave(mask):
+            # Preallocate 3 rows per edge and fill them with strided writes
+            k = int(mask.sum())
+            out = np.empty((3 * k, 3), dtype=np.float64)
+            out[0::3] = p1[mask]
+            out[1::3] = p2[mask]
+            out[2::3] = np.nan
+            return out
+        beam_pts = _interleave(is_beam)
+        col_pts = _interleave(is_col)
+
+    beams_x, beams_y, beams_z = _xyz_columns(beam_pts)
+    cols_x, cols_y, cols_z = _xyz_columns(col_pts)
+    if not build_hover:
+        return beams_x, beams_y, beams_z, None, cols_x, cols_y, cols_z, None
+
+    tags = np.array(keep, dtype=np.float64).reshape(-1, 3)
+
+    def _customdata(mask):
+        # One [etag, ni, nj, dx, dy, dz] row per vertex (p1, p2, break)
+        return np.repeat(np.hstack([tags[mask], d[mask]]), 3, axis=0)
+
+    return (beams_x, beams_y, beams_z, _customdata(is_beam),
+            cols_x, cols_y, cols_z, _customdata(is_col))
+
+
+def _node_marker_lists(
+    nodes: Dict[int, Vec3],
+):
+    """
+    Coordinates and (tag, x, y, z) customdata rows for the node marker trace.
+    The hover reads coordinates from the float64 rows, so it stays exact when
+    x/y/z are shipped as float32.
+    """
+    nx = [p[0] for p in nodes.values()]
+    ny = [p[1] for p in nodes.values()]
+    nz = [p[2] for p in nodes.values()]
+    if NUMPY_AVAILABLE and len(nodes) >= _NUMPY_MIN_NODES:
+        cd = np.column_stack((np.fromiter(nodes, dtype=np.float64, count=len(nodes)), nx, ny, nz))
+    else:
+        cd = [[t, p[0], p[1], p[2]] for t, p in nodes.items()]
+    return nx, ny, nz, cd
 
 
 def _local_axes_trace(
     nodes: Dict[int, Vec3],
     elements: Dict[int, Tuple[int, int]],
-    frac: float = 0.25
+    frac: float = 0.25,
+    soa=None,
 ):
     """
     Build a single Cone trace that shows local longitudinal axes (i -> j)
     for all given elements. Each arrow is anchored at the element midpoint.
+    Pass a prebuilt _build_edge_soa result as 'soa' to reuse it.
     """
     if not elements or not nodes or frac <= 0.0:
         return None
 
+    if soa is None and _use_edge_soa(elements):
+        soa = _build_edge_soa(nodes, elements)
+        if soa is None:
+            return None
+    if soa is not None:
+        _, p1, p2, d, L, _ = soa
+        ok = L > EPS
+        if not ok.any():
+            return None
+        Lk = L[ok]
+        axis_len = max(float(np.median(Lk)) * frac, EPS * 100.0)
+        mid = 0.5 * (p1[ok] + p2[ok])
+        uvw = d[ok] * (axis_len / Lk)[:, None]
+        return dict(
+            type="cone",
+            x=mid[:, 0], y=mid[:, 1], z=mid[:, 2],
+            u=uvw[:, 0], v=uvw[:, 1], w=uvw[:, 2],
+            anchor="tail",
+            showscale=False,
+            name="Local x (i→j)"
+        )
+
     lengths: List[float] = []
     for _, (ni, nj) in elements.items():
         if ni not in nodes or nj not in nodes:
@@ -152,7 +391,8 @@ def _local_axes_trace(
     if not lengths:
         return None
 
-    Lmed = _median(lengths)
+    # np.median partitions instead of sorting the whole list
+    Lmed = float(np.median(lengths)) if NUMPY_AVAILABLE else statistics.median(lengths)
     axis_len = max(Lmed * frac, EPS * 100.0)
 
     xs: List[float]; ys: List[float]; zs: List[float]
@@ -176,7 +416,8 @@ def _local_axes_trace(
     if not xs:
         return None
 
-    cone = go.Cone(
+    cone = dict(
+        type="cone",
         x=xs, y=ys, z=zs,
         u=us, v=vs, w=ws,
         anchor="tail",
@@ -187,6 +428,44 @@ def _local_axes_trace(
 
 
 # ---------- Boundary-condition overlay helpers ----------
+_BC_DOFS = ("UX", "UY", "UZ", "RX", "RY", "RZ")
+_BC_COLORS = {
+    "UX": "#1f77b4", "UY": "#2ca02c", "UZ": "#9467bd",
+    "RX": "#d62728", "RY": "#ff7f0e", "RZ": "#8c564b",
+}
+
+
+_COORD_KEYS = ("x", "y", "z", "u", "v", "w")
+# float32 resolves ~1e-7 of the largest |coordinate|; past this ratio of
+# offset to model extent (e.g. georeferenced meshes) that is visible detail
+_FP32_MAX_OFFSET_RATIO = 1e3
+
+
+def _fp32_safe(ranges) -> bool:
+    """True when float32 coordinates still resolve the model at its own scale."""
+    reach = max(abs(v) for r in ranges for v in r)
+    return reach <= _FP32_MAX_OFFSET_RATIO * _bbox_size(ranges)
+
+
+def _fp32_coords(trace: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Copy of a trace spec with its coordinate/vector arrays downcast to
+    float32 (None breaks become NaN). Halves the typed-array payload; ~7
+    significant digits is far below screen resolution as long as _fp32_safe
+    holds. customdata keeps float64 so tags and hover values stay exact.
+    """
+    out = dict(trace)
+    for k in _COORD_KEYS:
+        if k in out:
+            out[k] = np.asarray(out[k], dtype=np.float32)
+    return out
+
+
+def _bbox_size(ranges) -> float:
+    xr, yr, zr = ranges
+    return max(xr[1]-xr[0], yr[1]-yr[0], zr[1]-zr[0])
+
+
 def _triangle(center: Vec3, axis: str, r: float) -> Tuple[List[float], List[float], List[float]]:
     """
     Return a closed triangle polyline centered at node, lying in the plane
@@ -237,83 +516,114 @@ def _x_symbol(center: Vec3, axis: str, r: float) -> Tuple[List[float], List[floa
     zs = [a1[2], b1[2], None, a2[2], b2[2], None]
     return xs, ys, zs
 
+# Unit glyphs (center at origin, r = 1) as (rows, 3) arrays with NaN breaks;
+# a node's glyph is then center + r * template, which is exactly what the
+# scalar helpers compute.
+if NUMPY_AVAILABLE:
+    _GLYPH_TEMPLATES = {
+        key: np.array((_triangle if i < 3 else _x_symbol)((0.0, 0.0, 0.0), "XYZ"[i % 3], 1.0),
+                      dtype=np.float64).T
+        for i, key in enumerate(_BC_DOFS)
+    }
+
 def _supports_traces(
     nodes: Dict[int, Vec3],
     supports_by_node: Dict[int, Tuple[int,int,int,int,int,int]],
     dofs: Dict[str, bool],
     size: float = 0.25,
     exclude: Optional[Iterable[int]] = None,
-) -> List[go.Scatter3d]:
+    bbox: Optional[float] = None,
+) -> List[Dict[str, Any]]:
     """
-    Build per-DOF traces for supports.
+    Build the supports overlay as a single polyline trace.
       - **Translational (UX/UY/UZ): triangles** in plane ⟂ to axis.
       - **Rotational (RX/RY/RZ): 'x' symbols** in plane ⟂ to axis.
-    Excludes any node tags provided in 'exclude'.
+    Glyphs are colored per DOF (see _BC_COLORS) through a per-vertex
+    line.color array; empty legend-only proxies name the colors.
+    Excludes any node tags provided in 'exclude'. 'bbox' is the largest
+    padded axis span; it is derived from the nodes when not given.
     """
     if not nodes or not supports_by_node:
         return []
 
     excl: Set[int] = set(exclude or [])
+    active = [(i, key) for i, key in enumerate(_BC_DOFS) if dofs.get(key, False)]
+    if not active:
+        return []
 
-    # Per-DOF buffers (polyline coordinates with None breaks)
-    tri = { "UX": ([], [], []), "UY": ([], [], []), "UZ": ([], [], []) }
-    xsy = { "RX": ([], [], []), "RY": ([], [], []), "RZ": ([], [], []) }
+    # Single buffer (polyline coordinates with None breaks) + per-vertex colors
+    X: List[Optional[float]] = []
+    Y: List[Optional[float]] = []
+    Z: List[Optional[float]] = []
+    C: List[str] = []
+    used: Set[str] = set()
 
     # Auto scale: use a fraction of global bbox size
-    xr, yr, zr = _axis_ranges(nodes)
-    bbox = max(xr[1]-xr[0], yr[1]-yr[0], zr[1]-zr[0])
+    if bbox is None:
+        bbox = _bbox_size(_axis_ranges(nodes))
     L = max(bbox * max(size, 0.01), 1e-6)
     r_tri = 0.5 * L     # triangle "radius"
     r_x   = 0.5 * L     # x-symbol half-length
 
-    for n, mask in supports_by_node.items():
-        if n in excl or n not in nodes:
-            continue
-        cx, cy, cz = nodes[n]
-        ux, uy, uz, rx, ry, rz = mask
-
-        # Translational: triangles
-        if dofs.get("UX", True) and ux:
-            xs, ys, zs = _triangle((cx, cy, cz), "X", r_tri)
-            X, Y, Z = tri["UX"]; X += xs; Y += ys; Z += zs
-        if dofs.get("UY", True) and uy:
-            xs, ys, zs = _triangle((cx, cy, cz), "Y", r_tri)
-            X, Y, Z = tri["UY"]; X += xs; Y += ys; Z += zs
-        if dofs.get("UZ", True) and uz:
-            xs, ys, zs = _triangle((cx, cy, cz), "Z", r_tri)
-            X, Y, Z = tri["UZ"]; X += xs; Y += ys; Z += zs
-
-        # Rotational: 'x' symbols
-        if dofs.get("RX", True) and rx:
-            xs, ys, zs = _x_symbol((cx, cy, cz), "X", r_x)
-            X, Y, Z = xsy["RX"]; X += xs; Y += ys; Z += zs
-        if dofs.get("RY", True) and ry:
-            xs, ys, zs = _x_symbol((cx, cy, cz), "Y", r_x)
-            X, Y, Z = xsy["RY"]; X += xs; Y += ys; Z += zs
-        if dofs.get("RZ", True) and rz:
-            xs, ys, zs = _x_symbol((cx, cy, cz), "Z", r_x)
-            X, Y, Z = xsy["RZ"]; X += xs; Y += ys; Z += zs
-
-    traces: List[go.Scatter3d] = []
-
-    # Build triangle traces for UX/UY/UZ
-    for key, (xs, ys, zs) in tri.items():
-        if dofs.get(key, False) and xs:
-            traces.append(go.Scatter3d(
-                x=xs, y=ys, z=zs, mode="lines",
-                hoverinfo="skip", name=f"BC {key} (tri)",
-                line=dict(width=3)
-            ))
+    if NUMPY_AVAILABLE and len(supports_by_node) >= _NUMPY_MIN_SUPPORTS:
+        # Supports share a handful of masks (fixed, pinned, ...): group the
+        # centers by active-DOF pattern and broadcast one fused glyph per group.
+        groups: Dict[Tuple[bool, ...], List[Vec3]] = defaultdict(list)
+        for n, mask in supports_by_node.items():
+            if n in excl or n not in nodes:
+                continue
+            pattern = tuple(bool(mask[i]) for i, _ in active)
+            if any(pattern):
+                groups[pattern].append(nodes[n])
+        parts = []
+        for pattern, centers in groups.items():
+            keys = [key for (i, key), on in zip(active, pattern) if on]
+            tmpl = np.concatenate([
+                (r_tri if key[0] == "U" else r_x) * _GLYPH_TEMPLATES[key] for key in keys
+            ])
+            pts = (np.asarray(centers, dtype=np.float64)[:, None, :] + tmpl[None, :, :]).reshape(-1, 3)
+            parts.append(pts)
+            C += [_BC_COLORS[key] for key in keys for _ in range(len(_GLYPH_TEMPLATES[key]))] * len(centers)
+            used.update(keys)
+        if parts:
+            pts = np.concatenate(parts)
+            X, Y, Z = _xyz_columns(pts)
+    else:
+        for n, mask in supports_by_node.items():
+            if n in excl or n not in nodes:
+                continue
+            center = nodes[n]
+            for i, key in active:
+                if not mask[i]:
+                    continue
+                # Translational -> triangle, rotational -> 'x'
+                if i < 3:
+                    xs, ys, zs = _triangle(center, "XYZ"[i], r_tri)
+                else:
+                    xs, ys, zs = _x_symbol(center, "XYZ"[i - 3], r_x)
+                X += xs; Y += ys; Z += zs
+                C += [_BC_COLORS[key]] * len(xs)
+                used.add(key)
+
+    if len(X) == 0:
+        return []
 
-    # Build 'x' traces for RX/RY/RZ
-    for key, (xs, ys, zs) in xsy.items():
-        if dofs.get(key, False) and xs:
-            traces.append(go.Scatter3d(
-                x=xs, y=ys, z=zs, mode="lines",
-                hoverinfo="skip", name=f"BC {key} (x)",
-                line=dict(width=3)
+    traces: List[Dict[str, Any]] = [dict(
+        type="scatter3d",
+        x=X, y=Y, z=Z, mode="lines",
+        hoverinfo="skip", name="Supports (BC)",
+        legendgroup="supports", showlegend=False,
+        line=dict(width=3, color=C)
+    )]
+    for _, key in active:
+        if key in used:
+            traces.append(dict(
+                type="scatter3d",
+                x=[None], y=[None], z=[None], mode="lines",
+                hoverinfo="skip", name=f"BC {key} ({'tri' if key[0] == 'U' else 'x'})",
+                legendgroup="supports",
+                line=dict(width=3, color=_BC_COLORS[key])
             ))
-
     return traces
 
 
@@ -321,7 +631,7 @@ def _springs_trace(
     nodes: Dict[int, Vec3],
     springs_by_node: Dict[int, Dict[str, Any]],
     size: int = 10,
-) -> Optional[go.Scatter3d]:
+) -> Optional[Dict[str, Any]]:
     """
     Build a single trace for spring markers.
     Springs are rendered as **diamond symbols** in orange to distinguish them
@@ -333,7 +643,7 @@ def _springs_trace(
         size: Marker size
 
     Returns:
-        Scatter3d trace or None if no springs
+        Scatter3d trace spec or None if no springs
     """
     if not nodes or not springs_by_node:
         return None
@@ -370,7 +680,8 @@ def _springs_trace(
     if not xs:
         return None
 
-    trace = go.Scatter3d(
+    trace = dict(
+        type="scatter3d",
         x=xs, y=ys, z=zs,
         mode="markers",
         text=texts,
@@ -388,6 +699,128 @@ def _springs_trace(
     return trace
 
 
+# ---------- Figure layers / assembly ----------
+def _hover_spec(customdata, template: str) -> Dict[str, Any]:
+    """Trace keys for template hover, or no hover at all without customdata."""
+    if customdata is None:
+        return dict(hoverinfo="skip")
+    return dict(customdata=customdata, hovertemplate=template)
+
+
+def _nodes_layer(
+    nodes: Dict[int, Vec3],
+    node_size: int,
+    max_markers: int,
+    build_hover: bool = True,
+) -> List[Dict[str, Any]]:
+    nx, ny, nz, ncd = _node_marker_lists(nodes)
+    name = "Nodes"
+    if max_markers > 0 and len(ncd) > max_markers:
+        # Element polylines already trace every node position; a strided
+        # subset keeps the marker payload bounded on very large models.
+        step = -(-len(ncd) // max_markers)
+        nx, ny, nz, ncd = nx[::step], ny[::step], nz[::step], ncd[::step]
+        name = f"Nodes (1 of {step} shown)"
+    return [dict(
+        type="scatter3d",
+        x=nx, y=ny, z=nz,
+        mode="markers",
+        **_hover_spec(ncd if build_hover else None, _NODE_HOVER),
+        marker=dict(size=node_size),
+        name=name
+    )]
+
+
+def _elements_layer(
+    nodes: Dict[int, Vec3],
+    elements: Dict[int, Tuple[int, int]],
+    lw_beam: int,
+    lw_col: int,
+    soa=None,
+    build_hover: bool = True,
+) -> List[Dict[str, Any]]:
+    (bx, by, bz, bcd,
+     cx, cy, cz, ccd) = _segment_lists(nodes, elements, soa=soa, build_hover=build_hover)
+    traces: List[Dict[str, Any]] = []
+
+    if len(bx):  # Beams / Others
+        traces.append(dict(
+            type="scatter3d",
+            x=bx, y=by, z=bz,
+            mode="lines",
+            **_hover_spec(bcd, _ELEMENT_HOVER),
+            line=dict(width=lw_beam),
+            name="Beams/Other (X/Y)"
+        ))
+
+    if len(cx):  # Columns
+        traces.append(dict(
+            type="scatter3d",
+            x=cx, y=cy, z=cz,
+            mode="lines",
+            **_hover_spec(ccd, _ELEMENT_HOVER),
+            line=dict(width=lw_col),
+            name="Columns (Z)"
+        ))
+    return traces
+
+
+def _masters_layer(
+    nodes: Dict[int, Vec3],
+    mn_tags: Iterable[int],
+    mn_size: int,
+) -> List[Dict[str, Any]]:
+    mn_tags_list = [int(t) for t in mn_tags if int(t) in nodes]
+    if not mn_tags_list:
+        return []
+    mx = [nodes[t][0] for t in mn_tags_list]
+    my = [nodes[t][1] for t in mn_tags_list]
+    mz = [nodes[t][2] for t in mn_tags_list]
+    mtext = [f"MN {t}" for t in mn_tags_list]
+    mhover = [f"<b>Master Node</b> {t}<br>x={nodes[t][0]:.3f}, y={nodes[t][1]:.3f}, z={nodes[t][2]:.3f}" for t in mn_tags_list]
+    return [dict(
+        type="scatter3d",
+        x=mx, y=my, z=mz,
+        mode="markers",
+        text=mtext,
+        hovertext=mhover,
+        hoverinfo="text",
+        marker=dict(size=mn_size, color="red"),
+        name="Diaphragm Masters"
+    )]
+
+
+def _assemble_figure(
+    data_traces: List[Dict[str, Any]],
+    ranges,
+    n_nodes: int,
+    show_axes: bool,
+    show_grid: bool,
+) -> go.Figure:
+    """Wrap finished trace specs in a Figure; only view flags touch the layout."""
+    xr, yr, zr = ranges
+    print(f"[PLOT DIAGNOSTIC] Axis ranges: X={xr}, Y={yr}, Z={zr}")
+    print(f"[PLOT DIAGNOSTIC] Total nodes for range calc: {n_nodes}")
+    scene = dict(
+        xaxis=dict(title=dict(text="X"), showgrid=show_grid, zeroline=False, range=list(xr)),
+        yaxis=dict(title=dict(text="Y"), showgrid=show_grid, zeroline=False, range=list(yr)),
+        zaxis=dict(title=dict(text="Z"), showgrid=show_grid, zeroline=False, range=list(zr)),
+        aspectmode="data"
+    )
+    if not show_axes:
+        for ax in ("xaxis", "yaxis", "zaxis"):
+            scene[ax]["visible"] = False
+
+    layout = dict(
+        scene=scene,
+        showlegend=True,
+        margin=dict(l=0, r=0, t=30, b=0),
+        title=dict(text="OpenSees Domain")
+    )
+    # Specs are built here with known-good keys; skip per-property validation.
+    return go.Figure(data=data_traces, layout=layout, _validate=False)
+
+
 def create_interactive_plot(
     nodes: Dict[int, Vec3],
     elements: Dict[int, Tuple[int, int]],
@@ -406,6 +839,9 @@ def create_interactive_plot(
       - master_nodes: Iterable[int]
       - master_node_size: int
       - node_size: int
+      - max_node_markers: int  # decimate the node trace above this (0 = never)
+      - fp32_payload: bool     # float32 coordinates unless far off-origin (default True)
+      - hover: bool            # node/element hover labels (default True)
       - beam_thickness: int
       - column_thickness: int
       - show_supports: bool
@@ -425,10 +861,14 @@ def create_interactive_plot(
     local_axis_frac = float(options.get("local_axis_frac", 0.25))
 
     show_mn = bool(options.get("show_master_nodes", True))
-    mn_tags: Iterable[int] = options.get("master_nodes", []) or []
+    # Materialized once: the tags feed both the cache key and the layer
+    mn_tags: Tuple[int, ...] = tuple(options.get("master_nodes", []) or [])
     mn_size = int(options.get("master_node_size", 8))
 
     node_size = int(options.get("node_size", 3))
+    max_markers = int(options.get("max_node_markers", _MAX_NODE_MARKERS))
+    fp32_payload = bool(options.get("fp32_payload", True))
+    hover = bool(options.get("hover", True))
     lw_beam = int(options.get("beam_thickness", 2))
     lw_col  = int(options.get("column_thickness", 3))
 
@@ -444,93 +884,81 @@ def create_interactive_plot(
     springs_by_node = options.get("springs_by_node", {}) or {}
     springs_size = int(options.get("springs_size", 10))
 
-    data_traces = []
+    # Content snapshots; None disables caching for that input
+    nkey = _content_key(nodes)
+    ekey = _content_key(elements) if nkey is not None else None
+    geo = (nkey, ekey) if ekey is not None else None
+
+    def layer(key, build) -> List[Dict[str, Any]]:
+        # Finished trace specs per overlay, cached on the inputs each one
+        # depends on; view toggles then only pick which layers to include.
+        return _memo(key + (fp32,) if key is not None else None,
+                     lambda: [_fp32_coords(t) if fp32 else t for t in build()])
+
+    def edge_soa():
+        # Built at most once per geometry, shared by polylines and local axes
+        if not _use_edge_soa(elements):
+            return None
+        return _memo(("edges",) + geo if geo else None,
+                     lambda: _build_edge_soa(nodes, elements))
+
+    # One node scan for both the scene ranges and the BC glyph scale
+    ranges = _memo(("ranges", nkey) if nkey is not None else None,
+                   lambda: _axis_ranges(nodes))
+    fp32 = fp32_payload and NUMPY_AVAILABLE and _fp32_safe(ranges)
+
+    data_traces: List[Dict[str, Any]] = []
 
     # Nodes (markers)
     if show_nodes and nodes:
-        n_tags = sorted(nodes.keys())
-        nx = [nodes[i][0] for i in n_tags]
-        ny = [nodes[i][1] for i in n_tags]
-        nz = [nodes[i][2] for i in n_tags]
-        ntext = [f"Node {i}" for i in n_tags]
-        nhover = [f"<b>Node</b> {i}<br>x={nodes[i][0]:.3f}, y={nodes[i][1]:.3f}, z={nodes[i][2]:.3f}" for i in n_tags]
-        nodes_trace = go.Scatter3d(
-            x=nx, y=ny, z=nz,
-            mode="markers",
-            text=ntext,
-            hovertext=nhover,
-            hoverinfo="text",
-            marker=dict(size=node_size),
-            name="Nodes"
-        )
-        data_traces.append(nodes_trace)
+        data_traces += layer(
+            ("nodes", nkey, node_size, max_markers, hover) if nkey is not None else None,
+            lambda: _nodes_layer(nodes, node_size, max_markers, hover))
 
     # Elements (two polyline traces)
-    (bx, by, bz, btxt, bhov,
-     cx, cy, cz, ctxt, chov) = _segment_lists(nodes, elements)
-
-    if bx:  # Beams / Others
-        beams_trace = go.Scatter3d(
-            x=bx, y=by, z=bz,
-            mode="lines",
-            text=btxt,
-            hovertext=bhov,
-            hoverinfo="text",
-            line=dict(width=lw_beam),
-            name="Beams/Other (X/Y)"
-        )
-        data_traces.append(beams_trace)
-
-    if cx:  # Columns
-        cols_trace = go.Scatter3d(
-            x=cx, y=cy, z=cz,
-            mode="lines",
-            text=ctxt,
-            hovertext=chov,
-            hoverinfo="text",
-            line=dict(width=lw_col),
-            name="Columns (Z)"
-        )
-        data_traces.append(cols_trace)
+    data_traces += layer(
+        ("elements",) + geo + (lw_beam, lw_col, hover) if geo else None,
+        lambda: _elements_layer(nodes, elements, lw_beam, lw_col, edge_soa(), hover))
 
     # Local longitudinal axes (i -> j)
     if show_local_axes:
-        cone = _local_axes_trace(nodes, elements, frac=max(0.01, local_axis_frac))
-        if cone is not None:
-            data_traces.append(cone)
+        frac = max(0.01, local_axis_frac)
+        data_traces += layer(
+            ("local_axes", frac) + geo if geo else None,
+            lambda: [c for c in (_local_axes_trace(nodes, elements, frac=frac, soa=edge_soa()),)
+                     if c is not None])
 
     # Diaphragm Master Nodes — independent of show_nodes
     if show_mn and mn_tags:
-        mn_tags_list = [int(t) for t in mn_tags if int(t) in nodes]
-        if mn_tags_list:
-            mx = [nodes[t][0] for t in mn_tags_list]
-            my = [nodes[t][1] for t in mn_tags_list]
-            mz = [nodes[t][2] for t in mn_tags_list]
-            mtext = [f"MN {t}" for t in mn_tags_list]
-            mhover = [f"<b>Master Node</b> {t}<br>x={nodes[t][0]:.3f}, y={nodes[t][1]:.3f}, z={nodes[t][2]:.3f}" for t in mn_tags_list]
-            masters_trace = go.Scatter3d(
-                x=mx, y=my, z=mz,
-                mode="markers",
-                text=mtext,
-                hovertext=mhover,
-                hoverinfo="text",
-                marker=dict(size=mn_size, color="red"),
-                name="Diaphragm Masters"
-            )
-            data_traces.append(masters_trace)
+        mn_key = ("masters", nkey, mn_tags, mn_size) if nkey is not None else None
+        try:
+            hash(mn_key)
+        except TypeError:
+            mn_key = None  # unhashable tags: build without caching
+        data_traces += layer(mn_key, lambda: _masters_layer(nodes, mn_tags, mn_size))
 
     # Supports overlay (triangles for U*, 'x' for R*)
     if show_supports and supports_by_node:
-        bc_traces = _supports_traces(
+        bc_key = None
+        if nkey is not None:
+            skey = _content_key(supports_by_node)
+            dkey = _content_key(dict(supports_dofs))
+            try:
+                xkey = frozenset(supports_exclude)
+            except TypeError:
+                xkey = None
+            if skey is not None and dkey is not None and xkey is not None:
+                bc_key = ("supports", nkey, skey, dkey, supports_size, xkey)
+        data_traces += layer(bc_key, lambda: _supports_traces(
             nodes=nodes,
             supports_by_node=supports_by_node,
             dofs=supports_dofs,
             size=supports_size,
             exclude=supports_exclude,
-        )
-        data_traces.extend(bc_traces)
+            bbox=_bbox_size(ranges),
+        ))
 
-    # Springs overlay (diamond markers)
+    # Springs overlay (diamond markers); few points, built per call
     if show_springs and springs_by_node:
         springs_trace = _springs_trace(
             nodes=nodes,
@@ -538,28 +966,6 @@ def create_interactive_plot(
             size=springs_size,
         )
         if springs_trace is not None:
-            data_traces.append(springs_trace)
+            data_traces.append(_fp32_coords(springs_trace) if fp32 else springs_trace)
 
-    xr, yr, zr = _axis_ranges(nodes)
-    print(f"[PLOT DIAGNOSTIC] Axis ranges: X={xr}, Y={yr}, Z={zr}")
-    print(f"[PLOT DIAGNOSTIC] Total nodes for range calc: {len(nodes)}")
-    scene = dict(
-        xaxis=dict(title="X", showgrid=show_grid, zeroline=False, range=xr),
-        yaxis=dict(title="Y", showgrid=show_grid, zeroline=False, range=yr),
-        zaxis=dict(title="Z", showgrid=show_grid, zeroline=False, range=zr),
-        aspectmode="data"
-    )
-
-    fig = go.Figure(data=data_traces)
-    fig.update_layout(
-        scene=scene,
-        showlegend=True,
-        margin=dict(l=0, r=0, t=30, b=0),
-        title="OpenSees Domain"
-    )
-
-    if not show_axes:
-        fig.update_scenes(xaxis=dict(visible=False),
-                          yaxis=dict(visible=False),
-                          zaxis=dict(visible=False))
-    return fig
+    return _assemble_figure(data_traces, ranges, len(nodes), show_axes, show_grid)
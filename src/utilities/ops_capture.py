@@ -25,7 +25,7 @@ import os
 import sys
 import importlib
 from contextlib import contextmanager
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Set, Tuple
 
 from openseespy import opensees as _ops
 
@@ -39,6 +39,8 @@ _CAP: Dict[str, Any] = {
     "geom_transf": [],      # {"ttype": str, "tag": int, "args": list}
     "elements": [],         # {"etype": str, "tag": int, "i": int, "j": int, "args": list}
 }
+# Derived views of _CAP, built lazily and dropped by reset_capture() and the element wrappers
+_DERIVED: Dict[str, Any] = {}
 
 
 def reset_capture() -> None:
@@ -48,12 +50,32 @@ def reset_capture() -> None:
     _CAP["rigid_diaphragms"].clear()
     _CAP["geom_transf"].clear()
     _CAP["elements"].clear()
+    _DERIVED.clear()
 
 
 def get_capture() -> Dict[str, Any]:
     return _CAP
 
 
+def get_element_pairs() -> Set[Tuple[int, int]]:
+    """
+    Undirected (i, j) endpoint pairs of the captured elements. Memoized until the
+    next reset_capture() or element capture; treat as read-only.
+    """
+    cached = _DERIVED.get("element_pairs")
+    if cached is not None:
+        return cached
+    pairs: Set[Tuple[int, int]] = set()
+    for e in _CAP["elements"]:
+        try:
+            i = int(e["i"]); j = int(e["j"])
+            pairs.add((i, j) if i <= j else (j, i))
+        except Exception:
+            continue
+    _DERIVED["element_pairs"] = pairs
+    return pairs
+
+
 def save_capture(out_dir: str = "out", filename: str = "domain_capture.json") -> str:
     os.makedirs(out_dir, exist_ok=True)
     path = os.path.join(out_dir, filename)
@@ -97,6 +119,7 @@ def _wrap_element(etype: str, tag: int, i: int, j: int, *args: Any) -> None:
     _CAP["elements"].append(
         {"etype": str(etype), "tag": int(tag), "i": int(i), "j": int(j), "args": [*args]}
     )
+    _DERIVED.clear()
     _ORIG["element"](etype, tag, i, j, *args)
 
 
@@ -105,6 +128,7 @@ def _wrap_elasticBeamColumn(tag: int, i: int, j: int, *args: Any) -> None:
     _CAP["elements"].append(
         {"etype": "elasticBeamColumn", "tag": int(tag), "i": int(i), "j": int(j), "args": [*args]}
     )
+    _DERIVED.clear()
     _ORIG["elasticBeamColumn"](tag, i, j, *args)
 
 
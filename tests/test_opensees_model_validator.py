@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+Test OpenSeesModelValidator helpers that do not need a built model.
+
+Verifies:
+1. Artifacts rejected by orjson (NaN/Infinity) still load via the stdlib parser
+2. validation_data.json keeps infinite modal periods as Infinity
+3. Missing offsets get fresh per-record defaults
+4. The scalar bounds pass reads only x, y, z from every node
+5. Tracking results built on the helper thread reach validation_data.json
+"""
+import io
+import json
+import sys
+import tempfile
+import types
+import contextlib
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+with contextlib.redirect_stdout(io.StringIO()):
+    from validation import opensees_model_validator as omv
+
+
+@contextlib.contextmanager
+def _validator():
+    """Validator with PROJECT_ROOT and output_dir pointed at a scratch directory."""
+    saved_root = omv.PROJECT_ROOT
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        (root / "out").mkdir()
+        omv.PROJECT_ROOT = root
+        try:
+            yield omv.OpenSeesModelValidator(output_dir=str(root / "validation_output")), root
+        finally:
+            omv.PROJECT_ROOT = saved_root
+
+
+def test_load_artifact_non_finite():
+    """Test that NaN/Infinity artifacts fall back to json.loads instead of None"""
+    with _validator() as (validator, root):
+        (root / "out" / "beams.json").write_text(
+            '{"beams": [{"tag": 1, "length_off_i": NaN, "length_off_j": Infinity}]}', encoding="utf-8")
+        data = validator._load_artifact("beams.json")
+        assert data is not None
+        assert data["beams"][0]["tag"] == 1
+        assert data["beams"][0]["length_off_j"] == float("inf")
+        assert validator._load_artifact("missing.json") is None
+    print("✅ Non-finite artifacts load through the stdlib fallback")
+
+
+def test_validation_json_keeps_infinity():
+    """Test that non-finite periods are written as Infinity, not null"""
+    with _validator() as (validator, root):
+        # Seed the per-model caches so no ops.* call is needed
+        validator._modal_cache = {"periods": [float("inf"), 0.5], "frequencies": [0.0, 2.0]}
+        validator._tracking_cache = {}
+        with contextlib.redirect_stdout(io.StringIO()):
+            validator.save_validation_data(write_report=False)
+        text = (root / "validation_output" / "validation_data.json").read_text(encoding="utf-8")
+        assert "Infinity" in text
+        assert json.loads(text)["modal_analysis"]["periods"] == [float("inf"), 0.5]
+
+        assert not omv._has_non_finite({"periods": [0.5], "tags": (1, 2)})
+        assert omv._has_non_finite({"nested": [{"x": float("nan")}]})
+    print("✅ Infinite periods written as Infinity")
+
+
+def test_transform_record_defaults():
+    """Test that missing offsets default to {} / [0, 0, 0] without sharing objects"""
+    first = omv._transform_record({"tag": 1}, omv._COLUMN_TRANSFORM_FIELDS, omv.COLUMN_VECXZ)
+    second = omv._transform_record({"tag": 2}, omv._COLUMN_TRANSFORM_FIELDS, omv.COLUMN_VECXZ)
+    assert first["offsets_i"] == {} and first["offsets_j"] == {}
+    assert first["joint_offset_i"] == [0, 0, 0] and first["joint_offset_j"] == [0, 0, 0]
+    assert first["offsets_i"] is not second["offsets_i"]
+    assert first["joint_offset_i"] is not second["joint_offset_i"]
+    assert first["joint_offset_i"] is not first["joint_offset_j"]
+
+    beam = omv._transform_record({"tag": 3, "joint_offset_i": [0.1, 0, 0]},
+                                 omv._BEAM_TRANSFORM_FIELDS, omv.BEAM_VECXZ)
+    assert beam["joint_offset_i"] == [0.1, 0, 0] and beam["joint_offset_j"] == [0, 0, 0]
+    assert beam["transf_tag"] is None and beam["has_joint_offsets"] is False
+    print("✅ Transform records get per-record offset defaults")
+
+
+def test_scalar_bounds_ignore_extra_coords():
+    """Test the no-NumPy bounds fallback when nodeCoord returns more than 3 values"""
+    coords = {1: [0.0, 0.0, 0.0, 9.0], 2: [5.0, -2.0, 3.0, 9.0], 3: [1.0, 4.0, 6.0, -9.0]}
+    fake_ops = types.SimpleNamespace(
+        getNodeTags=lambda: list(coords), getEleTags=lambda: [], getNDM=lambda: 3, getNDF=lambda: 6,
+        nodeCoord=lambda tag: coords[tag])
+    saved = dict(vars(omv))
+    omv.ops, omv.NUMPY_AVAILABLE = fake_ops, False
+    try:
+        with _validator() as (validator, _):
+            bounds = validator._collect_model_info()["bounds"]
+    finally:
+        for name in ("ops", "NUMPY_AVAILABLE"):
+            if name in saved:
+                setattr(omv, name, saved[name])
+            else:
+                delattr(omv, name)
+    assert bounds == {"x_range": [0.0, 5.0], "y_range": [-2.0, 4.0], "z_range": [0.0, 6.0]}
+    print(f"✅ Scalar bounds: {bounds}")
+
+
+def test_tracking_built_alongside_modal():
+    """Test that save_validation_data fills tracking from the helper thread"""
+    with _validator() as (validator, root):
+        validator._modal_cache = {"periods": [0.5]}
+        with contextlib.redirect_stdout(io.StringIO()):
+            validator.save_validation_data(write_report=False)
+        assert validator._tracking_cache is not None
+        data = json.loads((root / "validation_output" / "validation_data.json").read_text(encoding="utf-8"))
+        assert data["tracking_elements"] == validator._tracking_cache
+    print("✅ Tracking elements built next to the modal analysis")
+
+
+if __name__ == "__main__":
+    test_load_artifact_non_finite()
+    test_validation_json_keeps_infinity()
+    test_transform_record_defaults()
+    test_scalar_bounds_ignore_extra_coords()
+    test_tracking_built_alongside_modal()
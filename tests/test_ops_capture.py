@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""
+Test the OpenSees capture helpers (src/utilities/ops_capture.py).
+
+Verifies:
+1. Captured element pairs are memoized and follow new captures
+"""
+import io
+import sys
+import contextlib
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import pytest
+
+pytest.importorskip("openseespy")
+
+from openseespy import opensees as ops
+from src.utilities import ops_capture
+
+
+def _beam(tag, i, j):
+    ops.element("elasticBeamColumn", tag, i, j, 0.1, 2.0e8, 8.0e7, 1.0e-3, 1.0e-3, 1.0e-3, 1)
+
+
+def test_element_pairs_memoized():
+    """Test that element pairs are built once and refreshed by new elements"""
+    with contextlib.redirect_stdout(io.StringIO()):
+        with ops_capture.capture_session():
+            ops.wipe()
+            ops.model("basic", "-ndm", 3, "-ndf", 6)
+            ops.node(1, 0.0, 0.0, 0.0)
+            ops.node(2, 4.0, 0.0, 0.0)
+            ops.node(3, 4.0, 5.0, 0.0)
+            ops.geomTransf("Linear", 1, 0.0, 0.0, 1.0)
+            _beam(1, 2, 1)
+            pairs = ops_capture.get_element_pairs()
+            assert pairs == {(1, 2)}
+            assert ops_capture.get_element_pairs() is pairs
+
+            _beam(2, 3, 2)
+            assert ops_capture.get_element_pairs() == {(1, 2), (2, 3)}
+
+            # Same element count, different content: the memo must not survive
+            ops_capture.get_capture()["elements"].pop()
+            _beam(3, 1, 3)
+            assert ops_capture.get_element_pairs() == {(1, 2), (1, 3)}
+
+    ops_capture.reset_capture()
+    assert ops_capture.get_element_pairs() == set()
+    print("✅ Element pairs memoized and refreshed")
+
+
+if __name__ == "__main__":
+    test_element_pairs_memoized()
+
@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""
+Test runtime verification (validation/verify_domain_vs_artifacts.py).
+
+Verifies:
+1. Artifact parses are cached until the file changes
+2. Nodes and fixes issued through names imported from openseespy.opensees
+   (the model_building style) are captured
+3. Unchanged inputs (including the capture snapshot) reuse the previous report
+"""
+import io
+import os
+import sys
+import json
+import tempfile
+import contextlib
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import pytest
+
+pytest.importorskip("openseespy")
+
+import validation.verify_domain_vs_artifacts as vda
+from src.utilities.ops_capture import get_capture
+
+
+_STUB_NODES = '''
+from openseespy.opensees import node, fix
+
+
+def define_nodes():
+    node(1, 0.0, 0.0, 0.0)
+    node(2, 0.0, 0.0, 3.0)
+    fix(1, 1, 1, 1, 1, 1, 1)
+'''
+
+_STUB_TRANSLATOR = '''
+from openseespy.opensees import wipe, model
+
+import rdc_capture_stub_nodes
+
+
+def build_model(stage="all"):
+    wipe()
+    model("basic", "-ndm", 3, "-ndf", 6)
+    rdc_capture_stub_nodes.define_nodes()
+'''
+
+_STUB_MODULES = ("MODEL_translator", "rdc_capture_stub_nodes")
+
+
+@contextlib.contextmanager
+def _stub_translator():
+    """
+    Put a two-node MODEL_translator first on sys.path and yield an artifacts
+    directory for it; the real translator (if loaded) is restored afterwards.
+    """
+    saved_modules = {n: sys.modules.pop(n) for n in _STUB_MODULES if n in sys.modules}
+    saved_translator = vda._TRANSLATOR
+    with tempfile.TemporaryDirectory() as tmp:
+        Path(tmp, "rdc_capture_stub_nodes.py").write_text(_STUB_NODES, encoding="utf-8")
+        Path(tmp, "MODEL_translator.py").write_text(_STUB_TRANSLATOR, encoding="utf-8")
+        artifacts = os.path.join(tmp, "out")
+        os.makedirs(artifacts)
+        nodes = {"nodes": [{"tag": 1, "x": 0.0, "y": 0.0, "z": 0.0},
+                           {"tag": 2, "x": 0.0, "y": 0.0, "z": 3.0}]}
+        Path(artifacts, "nodes.json").write_text(json.dumps(nodes), encoding="utf-8")
+        sys.path.insert(0, tmp)
+        vda._TRANSLATOR = None
+        try:
+            yield artifacts
+        finally:
+            sys.path.remove(tmp)
+            vda._TRANSLATOR = saved_translator
+            for n in _STUB_MODULES:
+                sys.modules.pop(n, None)
+            sys.modules.update(saved_modules)
+
+
+def _verify(artifacts, **kwargs):
+    out = io.StringIO()
+    with contextlib.redirect_stdout(out):
+        report = vda.compare_runtime_vs_artifacts(artifacts, "all", False, **kwargs)
+    return report, out.getvalue()
+
+
+def test_load_json_cached():
+    """Test that an unchanged artifact is parsed once and an edited one again"""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "nodes.json")
+        Path(path).write_text(json.dumps({"nodes": []}), encoding="utf-8")
+        first = vda._load_json(path)
+        assert vda._load_json(path) is first
+
+        Path(path).write_text(json.dumps({"nodes": [{"tag": 1}]}), encoding="utf-8")
+        assert vda._load_json(path) == {"nodes": [{"tag": 1}]}
+        assert vda._load_json(os.path.join(tmp, "missing.json")) == {}
+    print("✅ Artifact parses cached per file stamp")
+
+
+def test_runtime_capture_records_nodes_and_fixes():
+    """Test that modules binding OpenSees functions by name are captured"""
+    with _stub_translator() as artifacts:
+        _verify(artifacts)
+        cap = get_capture()
+        assert sorted(int(n["tag"]) for n in cap["nodes"]) == [1, 2]
+        assert [int(f["node"]) for f in cap["fixes"]] == [1]
+    print(f"✅ Captured {len(cap['nodes'])} nodes and {len(cap['fixes'])} fixes")
+
+
+def test_runtime_report_reused_when_inputs_unchanged():
+    """Test the signature short-cut and what invalidates it"""
+    with _stub_translator() as artifacts:
+        first, _ = _verify(artifacts)
+        again, log = _verify(artifacts)
+        assert "reusing it" in log
+        assert again["_sig"] == first["_sig"]
+
+        _, log = _verify(artifacts, force=True)
+        assert "reusing it" not in log
+
+        nodes_path = os.path.join(artifacts, "nodes.json")
+        st = os.stat(nodes_path)
+        os.utime(nodes_path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+        _, log = _verify(artifacts)
+        assert "reusing it" not in log
+
+        # A missing capture snapshot is rebuilt rather than reported as reused
+        capture_path = os.path.join(artifacts, "domain_capture.json")
+        os.remove(capture_path)
+        _, log = _verify(artifacts)
+        assert "reusing it" not in log
+        assert os.path.exists(capture_path)
+        _, log = _verify(artifacts)
+        assert "reusing it" in log
+    print("✅ Runtime report reused only for unchanged inputs")
+
+
+if __name__ == "__main__":
+    test_load_json_cached()
+    test_runtime_capture_records_nodes_and_fixes()
+    test_runtime_report_reused_when_inputs_unchanged()
+
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Test the report cache of validation/verify_model.py.
+
+Verifies:
+1. Unchanged artifacts reuse the cached report; touched ones rebuild it
+2. The report on disk follows the strict setting of each call
+"""
+import io
+import os
+import sys
+import json
+import shutil
+import tempfile
+import contextlib
+from pathlib import Path
+
+ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(ROOT))
+
+from validation.verify_model import verify_model
+
+
+@contextlib.contextmanager
+def _artifacts_copy():
+    """Scratch copy of the Ejemplo artifacts, so reports and touches stay local."""
+    with tempfile.TemporaryDirectory() as tmp:
+        for name in os.listdir(ROOT / "artifacts_Ejemplo"):
+            shutil.copy(ROOT / "artifacts_Ejemplo" / name, tmp)
+        yield tmp
+
+
+def _verify(artifacts_dir, strict=False):
+    with contextlib.redirect_stdout(io.StringIO()):
+        return verify_model(artifacts_dir, strict=strict)
+
+
+def test_verify_model_reuses_cached_report():
+    """Test that reports are memoized on artifact stamps"""
+    with _artifacts_copy() as tmp:
+        first = _verify(tmp)
+        assert _verify(tmp) is first
+
+        # A touched artifact changes its stamp and forces a rebuild
+        nodes_path = os.path.join(tmp, "nodes.json")
+        st = os.stat(nodes_path)
+        os.utime(nodes_path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+        rebuilt = _verify(tmp)
+        assert rebuilt is not first
+        assert rebuilt["checks"] == first["checks"]
+        print(f"✅ Cached report reused; rebuilt after touch ({first['summary']})")
+
+
+def test_verify_model_cache_follows_strict():
+    """Test that alternating strict settings always leave the matching report on disk"""
+    with _artifacts_copy() as tmp:
+        out_path = os.path.join(tmp, "verify_report.json")
+        expected = {}
+        for strict in (False, True, False, True):
+            report = _verify(tmp, strict)
+            expected.setdefault(strict, report["summary"])
+            # Second round is served from the cache
+            assert report["summary"] == expected[strict]
+            with open(out_path, "r", encoding="utf-8") as f:
+                assert json.load(f)["summary"] == report["summary"]
+
+        # The example model has warnings, so strict mode must fail it
+        assert expected == {False: "WARN", True: "FAIL"}
+        print(f"✅ Report on disk tracks strict: {expected}")
+
+
+if __name__ == "__main__":
+    test_verify_model_reuses_cached_report()
+    test_verify_model_cache_follows_strict()
+
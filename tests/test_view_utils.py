@@ -0,0 +1,296 @@
+#!/usr/bin/env python3
+"""
+Test the 3D viewer trace builders (apps/view_utils_App.py).
+
+Verifies:
+1. Scalar and NumPy polyline builders emit the same geometry
+2. Derived geometry is cached on content, not identity
+3. Scalar and NumPy support glyph builders emit the same glyphs
+4. The optional numba packer matches the scalar builder
+5. Node markers are decimated above max_node_markers
+6. Coordinates ship as float32 unless disabled
+7. Overlay toggles reuse the cached element layer
+8. hover=False drops hover payloads
+9. Grouped support glyphs handle mixed masks, DOF filters and exclusions
+10. Diaphragm masters render when master_nodes is a generator
+11. Far-offset models keep float64 coordinates and exact node hover
+12. The shared geometry cache stays consistent under threads
+"""
+import io
+import sys
+import contextlib
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from apps import view_utils_App as vu
+
+
+@contextlib.contextmanager
+def _patched(**attrs):
+    """Temporarily override module-level switches of view_utils_App."""
+    saved = {k: getattr(vu, k) for k in attrs}
+    for k, v in attrs.items():
+        setattr(vu, k, v)
+    try:
+        yield
+    finally:
+        for k, v in saved.items():
+            setattr(vu, k, v)
+
+
+def _frame_model(nx=6, ny=5, stories=4, origin=(0.0, 0.0, 0.0)):
+    """Regular 3D frame: grid nodes per story, beams along X/Y, columns along Z."""
+    x0, y0, z0 = origin
+    nodes = {}
+    index = {}
+    tag = 1
+    for k in range(stories + 1):
+        for j in range(ny):
+            for i in range(nx):
+                nodes[tag] = (x0 + 5.0 * i, y0 + 4.0 * j, z0 + 3.0 * k)
+                index[i, j, k] = tag
+                tag += 1
+    elements = {}
+    etag = 1
+    for (i, j, k), n in index.items():
+        for nb in ((i + 1, j, k), (i, j + 1, k), (i, j, k + 1)):
+            if nb in index:
+                elements[etag] = (n, index[nb])
+                etag += 1
+    # A degenerate edge and one with a missing end node exercise the filters
+    elements[etag] = (1, 1)
+    elements[etag + 1] = (1, 10 ** 9)
+    return nodes, elements
+
+
+def _plot(nodes, elements, options=None):
+    with contextlib.redirect_stdout(io.StringIO()):
+        return vu.create_interactive_plot(nodes, elements, options or {})
+
+
+def _normalized(seq):
+    """Builder output as comparable data: float arrays (None -> NaN) or label lists."""
+    if seq is None:
+        return None
+    items = list(seq)
+    if any(isinstance(v, str) for v in items):
+        return items
+    return np.array(items, dtype=np.float64)
+
+
+def _assert_same_output(got, ref):
+    assert len(got) == len(ref)
+    for g, r in zip(got, ref):
+        g, r = _normalized(g), _normalized(r)
+        if r is None or isinstance(r, list):
+            assert g == r
+        else:
+            np.testing.assert_allclose(g, r, rtol=0, atol=1e-12)
+
+
+def test_polyline_paths_match():
+    """Test that the NumPy polyline builder splits beams/columns like the scalar one"""
+    nodes, elements = _frame_model()
+
+    with _patched(_NUMPY_MIN_EDGES=10 ** 9):
+        scalar = vu._segment_lists(nodes, elements)
+    assert isinstance(scalar[0], list) and len(scalar[0]) > 0
+
+    with _patched(_NUMPY_MIN_EDGES=0):
+        vectorized = vu._segment_lists(nodes, elements)
+    _assert_same_output(vectorized, scalar)
+    print(f"✅ NumPy polylines match scalar ({len(elements)} elements)")
+
+
+def test_geometry_cache_keys_on_content():
+    """Test that equal models reuse cached geometry and edited ones do not"""
+    nodes, elements = _frame_model()
+    vu._GEOM_CACHE.clear()
+    _plot(nodes, elements)
+    cached = len(vu._GEOM_CACHE)
+    assert cached > 0
+
+    # Fresh but equal dicts (a Streamlit rerun) hit the cache
+    _plot(dict(nodes), dict(elements))
+    assert len(vu._GEOM_CACHE) == cached
+
+    moved = dict(nodes)
+    moved[1] = (-1.0, -1.0, 0.0)
+    _plot(moved, elements)
+    assert len(vu._GEOM_CACHE) > cached
+    print(f"✅ Geometry cache keyed on content ({len(vu._GEOM_CACHE)} entries)")
+
+
+def _glyphs(trace):
+    """Support glyphs as a sorted list of (x, y, z, color) chunks split at breaks."""
+    xs, ys, zs = (_normalized(trace[k]) for k in ("x", "y", "z"))
+    colors = list(trace["line"]["color"])
+    chunks, cur = [], []
+    for x, y, z, c in zip(xs, ys, zs, colors):
+        if np.isnan(x):
+            chunks.append(tuple(cur))
+            cur = []
+        else:
+            cur.append((round(x, 9), round(y, 9), round(z, 9), c))
+    if cur:
+        chunks.append(tuple(cur))
+    return sorted(chunks)
+
+
+def _assert_same_supports(nodes, supports, dofs, exclude=None):
+    with _patched(_NUMPY_MIN_SUPPORTS=10 ** 9):
+        scalar = vu._supports_traces(nodes, supports, dofs, exclude=exclude)
+    with _patched(_NUMPY_MIN_SUPPORTS=0):
+        vectorized = vu._supports_traces(nodes, supports, dofs, exclude=exclude)
+    assert [t["name"] for t in vectorized] == [t["name"] for t in scalar]
+    assert _glyphs(vectorized[0]) == _glyphs(scalar[0])
+    return len(_glyphs(scalar[0]))
+
+
+def test_support_paths_match():
+    """Test that broadcast NumPy support glyphs match the per-node scalar ones"""
+    nodes, _ = _frame_model()
+    base = [t for t, p in nodes.items() if p[2] == 0.0]
+    supports = {t: (1, 1, 1, 1, 1, 1) for t in base}
+    dofs = {"UX": True, "UY": True, "UZ": True, "RX": True, "RY": True, "RZ": True}
+    n = _assert_same_supports(nodes, supports, dofs)
+    print(f"✅ Support glyphs match ({n} glyphs)")
+
+
+def test_polyline_numba_path_matches():
+    """Test that the numba packer matches the scalar builder"""
+    pytest.importorskip("numba")
+    nodes, elements = _frame_model()
+
+    with _patched(_NUMPY_MIN_EDGES=10 ** 9):
+        scalar = vu._segment_lists(nodes, elements)
+    with _patched(_NUMPY_MIN_EDGES=0, _NUMBA_MIN_EDGES=0):
+        packed = vu._segment_lists(nodes, elements)
+    _assert_same_output(packed, scalar)
+    print("✅ numba polylines match scalar")
+
+
+def test_node_markers_decimated():
+    """Test that the node trace is strided down to max_node_markers"""
+    nodes, elements = _frame_model()
+    fig = _plot(nodes, elements, {"max_node_markers": 40})
+    marker = [t for t in fig.data if t.name.startswith("Nodes")]
+    assert len(marker) == 1
+    assert 0 < len(marker[0].x) <= 40
+    assert marker[0].name.startswith("Nodes (1 of ")
+
+    fig = _plot(nodes, elements, {"max_node_markers": 0})
+    assert [len(t.x) for t in fig.data if t.name == "Nodes"] == [len(nodes)]
+    print("✅ Node markers decimated")
+
+
+def test_fp32_payload():
+    """Test that coordinates ship as float32 by default and float64 on request"""
+    nodes, elements = _frame_model()
+    fig = _plot(nodes, elements)
+    assert {np.asarray(t.x).dtype for t in fig.data} == {np.dtype(np.float32)}
+
+    fig = _plot(nodes, elements, {"fp32_payload": False})
+    assert np.dtype(np.float32) not in {np.asarray(t.x).dtype for t in fig.data}
+    print("✅ float32 payload by default")
+
+
+def test_fp32_skipped_far_from_origin():
+    """Test that georeferenced models keep float64 and exact node hover values"""
+    nodes, elements = _frame_model(origin=(4.5e6, 5.2e5, 0.0))
+    fig = _plot(nodes, elements)
+    assert np.dtype(np.float32) not in {np.asarray(t.x).dtype for t in fig.data}
+
+    node_trace = next(t for t in fig.data if t.name == "Nodes")
+    assert "customdata[1]" in node_trace.hovertemplate
+    cd = np.asarray(node_trace.customdata, dtype=np.float64)
+    tag = int(cd[7][0])
+    assert tuple(cd[7][1:]) == nodes[tag]
+    print("✅ Far-offset coordinates keep float64")
+
+
+def test_overlay_toggle_reuses_element_layer():
+    """Test that toggling an overlay only builds that overlay's layer"""
+    nodes, elements = _frame_model()
+    vu._GEOM_CACHE.clear()
+    _plot(nodes, elements, {"show_local_axes": False})
+    _plot(nodes, elements, {"show_local_axes": True})
+    _plot(nodes, elements, {"show_local_axes": False})
+    element_layers = [k for k in vu._GEOM_CACHE if k[0] == "elements"]
+    assert len(element_layers) == 1
+    print("✅ Element layer reused across toggles")
+
+
+def test_generator_master_nodes():
+    """Test that a one-shot iterator of master tags still renders the masters trace"""
+    nodes, elements = _frame_model(nx=3, ny=3, stories=2)
+    masters = [t for t, p in nodes.items() if p[2] > 0.0][:2]
+
+    fig = _plot(nodes, elements, {"master_nodes": (t for t in masters)})
+    assert [len(t.x) for t in fig.data if t.name == "Diaphragm Masters"] == [len(masters)]
+
+    # Same tags again are served by the cached layer
+    fig = _plot(nodes, elements, {"master_nodes": iter(masters)})
+    assert [len(t.x) for t in fig.data if t.name == "Diaphragm Masters"] == [len(masters)]
+    print("✅ Masters trace rendered from a generator")
+
+
+def test_hover_disabled():
+    """Test that hover=False ships no customdata or hover templates"""
+    nodes, elements = _frame_model()
+    fig = _plot(nodes, elements, {"hover": False})
+    for t in fig.data:
+        if t.name.startswith("Nodes") or t.name in ("Beams", "Columns"):
+            assert t.customdata is None and t.hovertemplate is None
+            assert t.hoverinfo == "skip"
+    print("✅ hover=False drops hover payloads")
+
+
+def test_grouped_support_masks_match():
+    """Test mixed masks, partial DOF filters and exclusions on the grouped path"""
+    nodes, _ = _frame_model()
+    masks = [(1, 1, 1, 1, 1, 1), (1, 1, 1, 0, 0, 0), (0, 0, 1, 0, 0, 0), (1, 0, 0, 0, 0, 1)]
+    base = [t for t, p in nodes.items() if p[2] == 0.0]
+    supports = {t: masks[k % len(masks)] for k, t in enumerate(base)}
+    dofs = {"UX": True, "UY": True, "UZ": True, "RX": True, "RY": False, "RZ": True}
+    n = _assert_same_supports(nodes, supports, dofs, exclude={base[0]})
+    print(f"✅ Grouped support glyphs match ({n} glyphs)")
+
+
+def test_geometry_cache_threads():
+    """Test concurrent plots from several threads against the shared cache"""
+    from concurrent.futures import ThreadPoolExecutor
+
+    models = [_frame_model(origin=(float(m), 0.0, 0.0)) for m in range(24)]
+
+    def run(k):
+        nodes, elements = models[k % len(models)]
+        return len(vu.create_interactive_plot(nodes, elements, {}).data)
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        with ThreadPoolExecutor(max_workers=8) as ex:
+            counts = set(ex.map(run, range(200)))
+    assert len(counts) == 1
+    assert len(vu._GEOM_CACHE) <= vu._GEOM_CACHE_MAX
+    print("✅ Geometry cache consistent under threads")
+
+
+if __name__ == "__main__":
+    test_polyline_paths_match()
+    test_geometry_cache_keys_on_content()
+    test_support_paths_match()
+    test_polyline_numba_path_matches()
+    test_node_markers_decimated()
+    test_fp32_payload()
+    test_overlay_toggle_reuses_element_layer()
+    test_hover_disabled()
+    test_grouped_support_masks_match()
+    test_generator_master_nodes()
+    test_fp32_skipped_far_from_origin()
+    test_geometry_cache_threads()
+
@@ -23,7 +23,12 @@ import sys
 import os
 import argparse
 import json
+import io
+import math
+import mmap
+import threading
 import importlib.util
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
 from typing import Dict, List, Any, Optional, Tuple
@@ -46,6 +51,18 @@ except ImportError:
     TESTING_FRAMEWORK_AVAILABLE = False
     print("WARNING: Testing framework not available")
 
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 try:
     import matplotlib.pyplot as plt
     import matplotlib.patches as patches
@@ -53,18 +70,174 @@ try:
 except ImportError:
     MATPLOTLIB_AVAILABLE = False
 
+_INV_TWO_PI = 1.0 / (2.0 * math.pi)
+# Mode count from which the frequency conversion is vectorized with NumPy
+_NUMPY_MIN_MODES = 32
+# Vector length from which offset comparisons go through numpy.allclose
+_NUMPY_MIN_OFFSET_LEN = 16
+
+# Text report separator lines (newline-terminated)
+_SEP_EQ50 = "=" * 50 + "\n"
+_SEP_DASH15 = "-" * 15 + "\n"
+_SEP_DASH20 = "-" * 20 + "\n"
+_SEP_DASH25 = "-" * 25 + "\n"
+_SEP_DASH30 = "-" * 30 + "\n"
+
+# Expected joint offsets for the tracking elements
+B408_EXPECTED_OFFSET_I = (0.4, 0.0, 0.0)  # LENGTHOFFI = 0.4
+# Rigid ends (0.275) + lateral offsets (-0.05, 0.2, 0.0)
+C522_EXPECTED_OFFSET_I = (-0.05, 0.2, 0.275)
+C522_EXPECTED_OFFSET_J = (-0.05, 0.2, -0.275)
+
+# Tracking elements: (result key, transforms list, line, story,
+#                     ((status key, offset field, expected offset), ...))
+TRACKED_ELEMENTS = (
+    ("beam_b408", "beam_transforms", "B408", "11_P6", (
+        ("beam_b408_offset_correct", "joint_offset_i", B408_EXPECTED_OFFSET_I),
+    )),
+    ("column_c522", "column_transforms", "C522", "02_P2", (
+        ("column_c522_offset_i_correct", "joint_offset_i", C522_EXPECTED_OFFSET_I),
+        ("column_c522_offset_j_correct", "joint_offset_j", C522_EXPECTED_OFFSET_J),
+    )),
+)
+
+# (record key, artifact key, default) for per-element transform records.
+# Mutable defaults are given as factories so each record gets its own object.
+
+
+def _zero_offset() -> List[int]:
+    return [0, 0, 0]
+
+
+_BEAM_TRANSFORM_FIELDS = (
+    ("element_tag", "tag", None),
+    ("line", "line", None),
+    ("story", "story", None),
+    ("transf_tag", "transf_tag", None),
+    ("length_off_i", "length_off_i", 0.0),
+    ("length_off_j", "length_off_j", 0.0),
+    ("joint_offset_i", "joint_offset_i", _zero_offset),
+    ("joint_offset_j", "joint_offset_j", _zero_offset),
+    ("has_joint_offsets", "has_joint_offsets", False),
+)
+_COLUMN_TRANSFORM_FIELDS = (
+    ("element_tag", "tag", None),
+    ("line", "line", None),
+    ("story", "story", None),
+    ("transf_tag", "transf_tag", None),
+    ("length_off_i", "length_off_i", 0.0),
+    ("length_off_j", "length_off_j", 0.0),
+    ("offsets_i", "offsets_i", dict),
+    ("offsets_j", "offsets_j", dict),
+    ("joint_offset_i", "joint_offset_i", _zero_offset),
+    ("joint_offset_j", "joint_offset_j", _zero_offset),
+    ("has_joint_offsets", "has_joint_offsets", False),
+)
+BEAM_VECXZ = (0, 0, 1)
+COLUMN_VECXZ = (1, 0, 0)
+
+
+def _transform_record(element: Dict[str, Any], fields, vecxz) -> Dict[str, Any]:
+    """Build the transform record for one beam/column artifact entry."""
+    record = {}
+    for key, src, default in fields:
+        if src in element:
+            record[key] = element[src]
+        else:
+            record[key] = default() if callable(default) else default
+    record["vecxz"] = list(vecxz)
+    return record
+
+
+def _offsets_match(actual, expected, tol: float = 1e-6) -> bool:
+    """
+    Component-wise absolute comparison of two offset vectors.
+    Joint offsets are 3-vectors, where a plain zip/all loop beats the fixed
+    cost of numpy.allclose; NumPy is only used for long vectors.
+    """
+    if len(actual) != len(expected):
+        return False
+    if NUMPY_AVAILABLE and len(expected) >= _NUMPY_MIN_OFFSET_LEN:
+        return bool(np.allclose(np.asarray(actual, dtype=float), np.asarray(expected, dtype=float),
+                                atol=tol, rtol=0.0))
+    return all(abs(a - e) < tol for a, e in zip(actual, expected))
+
+
+def _has_non_finite(obj) -> bool:
+    """True if a JSON-bound payload holds NaN/Infinity (e.g. periods of zero eigenvalues)."""
+    if isinstance(obj, float):
+        return not math.isfinite(obj)
+    if isinstance(obj, dict):
+        return any(_has_non_finite(v) for v in obj.values())
+    if isinstance(obj, (list, tuple)):
+        return any(_has_non_finite(v) for v in obj)
+    if NUMPY_AVAILABLE and isinstance(obj, (np.ndarray, np.floating)):
+        return not bool(np.isfinite(obj).all())
+    return False
+
 
 class OpenSeesModelValidator:
     """Standalone OpenSees model validator with comprehensive reporting."""
 
-    def __init__(self, model_path: str = "out/model.py", output_dir: str = "validation_output"):
+    __slots__ = (
+        "model_path", "output_dir", "skip_modal",
+        "model_info", "test_results", "validation_data", "_test_totals",
+        "_node_tags", "_element_tags", "_ndm", "_ndf", "_modal_cache",
+        "_transforms_cache", "_tracking_cache", "_artifact_lock",
+    )
+
+    def __init__(self, model_path: str = "out/model.py", output_dir: str = "validation_output",
+                 skip_modal: bool = False):
         self.model_path = Path(model_path)
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(exist_ok=True)
+        self.skip_modal = skip_modal
 
         self.model_info = {}
         self.test_results = {}
         self.validation_data = {}
+        self._test_totals: Optional[Tuple[int, int]] = None  # (total, passed)
+
+        # Domain queries and modal results for the currently loaded model
+        # (each ops.* call crosses into C++; ops.eigen is expensive)
+        self._node_tags: Optional[List[int]] = None
+        self._element_tags: Optional[List[int]] = None
+        self._ndm = None
+        self._ndf = None
+        self._modal_cache: Optional[Dict[str, Any]] = None
+
+        # Artifact-derived results, built lazily; the lock makes concurrent
+        # first access from worker threads compute them only once.
+        self._transforms_cache: Optional[Dict[str, Any]] = None
+        self._tracking_cache: Optional[Dict[str, Any]] = None
+        self._artifact_lock = threading.RLock()
+
+    def invalidate(self):
+        """Drop cached data derived from the loaded model and its artifacts."""
+        self._node_tags = None
+        self._element_tags = None
+        self._ndm = None
+        self._ndf = None
+        self._modal_cache = None
+        with self._artifact_lock:
+            self._transforms_cache = None
+            self._tracking_cache = None
+
+    @property
+    def transforms(self) -> Dict[str, Any]:
+        """Geometric transformation analysis, computed on first access."""
+        with self._artifact_lock:
+            if self._transforms_cache is None:
+                self._transforms_cache = self._compute_geometric_transformations()
+            return self._transforms_cache
+
+    @property
+    def tracking(self) -> Dict[str, Any]:
+        """Tracking element verification, computed on first access."""
+        with self._artifact_lock:
+            if self._tracking_cache is None:
+                self._tracking_cache = self._compute_tracking_elements()
+            return self._tracking_cache
 
     def load_model(self) -> bool:
         """Load and build the OpenSees model from Python file."""
@@ -79,8 +252,9 @@ class OpenSeesModelValidator:
         try:
             print(f"Loading model from: {self.model_path}")
 
-            # Clear any existing model
+            # Clear any existing model and results derived from it
             ops.wipe()
+            self.invalidate()
 
             # Load the model module
             spec = importlib.util.spec_from_file_location("model", self.model_path)
@@ -106,36 +280,84 @@ class OpenSeesModelValidator:
     def _collect_model_info(self) -> Dict[str, Any]:
         """Collect basic model information."""
         try:
-            node_tags = ops.getNodeTags()
-            element_tags = ops.getEleTags()
+            # Query the domain once; later phases reuse the cached values
+            self._node_tags = node_tags = ops.getNodeTags()
+            self._element_tags = element_tags = ops.getEleTags()
+            self._ndm = ops.getNDM()
+            self._ndf = ops.getNDF()
+
+            # Calculate model bounds over all nodes
+            bounds = {}
+            if node_tags and NUMPY_AVAILABLE:
+                coords = self._node_coord_array(node_tags)
+                mins = coords.min(axis=0).tolist()
+                maxs = coords.max(axis=0).tolist()
 
-            # Calculate model bounds
-            coords = [ops.nodeCoord(tag) for tag in node_tags[:100]]  # Sample first 100 nodes
-            if coords:
-                x_coords = [c[0] for c in coords]
-                y_coords = [c[1] for c in coords]
-                z_coords = [c[2] for c in coords]
+                bounds = {
+                    "x_range": [mins[0], maxs[0]],
+                    "y_range": [mins[1], maxs[1]],
+                    "z_range": [mins[2], maxs[2]]
+                }
+            elif node_tags:
+                # Single pass with six accumulators (no per-axis lists)
+                coords = (ops.nodeCoord(tag)[:3] for tag in node_tags)
+                xmin, ymin, zmin = next(coords)
+                xmax, ymax, zmax = xmin, ymin, zmin
+                for x, y, z in coords:
+                    if x < xmin:
+                        xmin = x
+                    elif x > xmax:
+                        xmax = x
+                    if y < ymin:
+                        ymin = y
+                    elif y > ymax:
+                        ymax = y
+                    if z < zmin:
+                        zmin = z
+                    elif z > zmax:
+                        zmax = z
 
                 bounds = {
-                    "x_range": [min(x_coords), max(x_coords)],
-                    "y_range": [min(y_coords), max(y_coords)],
-                    "z_range": [min(z_coords), max(z_coords)]
+                    "x_range": [xmin, xmax],
+                    "y_range": [ymin, ymax],
+                    "z_range": [zmin, zmax]
                 }
-            else:
-                bounds = {}
 
             return {
                 "model_file": str(self.model_path),
                 "load_time": datetime.now().isoformat(),
                 "nodes": len(node_tags),
                 "elements": len(element_tags),
-                "ndm": ops.getNDM(),
-                "ndf": ops.getNDF(),
+                "ndm": self._ndm,
+                "ndf": self._ndf,
                 "bounds": bounds
             }
         except Exception as e:
             return {"error": f"Failed to collect model info: {e}"}
 
+    @staticmethod
+    def _node_coord_array(node_tags: List[int]):
+        """
+        (N, 3) float64 array of node coordinates. Uses a bulk getter when the
+        installed OpenSeesPy build exposes one (a single C++ round-trip);
+        otherwise falls back to one nodeCoord call per node. Row order follows
+        the bulk getter, which is fine for order-independent reductions.
+        """
+        bulk_getter = getattr(ops, "nodeCoords", None)
+        if bulk_getter is not None:
+            try:
+                coords = np.asarray(bulk_getter(), dtype=np.float64).reshape(-1, 3)
+            except (TypeError, ValueError):
+                coords = None
+            if coords is not None and len(coords) == len(node_tags):
+                return coords
+
+        return np.fromiter(
+            (v for tag in node_tags for v in ops.nodeCoord(tag)[:3]),
+            dtype=np.float64,
+            count=len(node_tags) * 3,
+        ).reshape(-1, 3)
+
     def run_validation_tests(self) -> bool:
         """Run comprehensive validation tests."""
         if not TESTING_FRAMEWORK_AVAILABLE:
@@ -148,8 +370,7 @@ class OpenSeesModelValidator:
             self.test_results = tester.run_all_tests()
 
             # Summary statistics
-            total_tests = sum(suite.total_tests for suite in self.test_results.values())
-            passed_tests = sum(suite.passed_tests for suite in self.test_results.values())
+            total_tests, passed_tests = self._tally_tests()
 
             print(f"Tests completed: {passed_tests}/{total_tests} passed ({passed_tests/total_tests*100:.1f}%)")
             return True
@@ -158,14 +379,30 @@ class OpenSeesModelValidator:
             print(f"ERROR running tests: {e}")
             return False
 
+    def _tally_tests(self) -> Tuple[int, int]:
+        """Count (total, passed) tests over all suites in one pass and remember it."""
+        total_tests = passed_tests = 0
+        for suite in self.test_results.values():
+            total_tests += suite.total_tests
+            passed_tests += suite.passed_tests
+        self._test_totals = (total_tests, passed_tests)
+        return self._test_totals
+
     def extract_geometric_transformations(self) -> Dict[str, Any]:
         """Extract and analyze geometric transformations."""
+        return self.transforms
+
+    def _compute_geometric_transformations(self) -> Dict[str, Any]:
+        """Build transformation records and joint offset summary from artifacts."""
         try:
             print("Analyzing geometric transformations...")
 
-            # Load artifact data for transformation analysis
-            beam_data = self._load_artifact("beams.json")
-            column_data = self._load_artifact("columns.json")
+            # Load artifact data for transformation analysis (independent reads)
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                beam_future = executor.submit(self._load_artifact, "beams.json")
+                column_future = executor.submit(self._load_artifact, "columns.json")
+                beam_data = beam_future.result()
+                column_data = column_future.result()
 
             transformation_info = {
                 "beam_transforms": [],
@@ -179,45 +416,25 @@ class OpenSeesModelValidator:
 
             # Analyze beam transformations
             if beam_data and "beams" in beam_data:
-                for beam in beam_data["beams"]:
-                    transform_info = {
-                        "element_tag": beam.get("tag"),
-                        "line": beam.get("line"),
-                        "story": beam.get("story"),
-                        "transf_tag": beam.get("transf_tag"),
-                        "length_off_i": beam.get("length_off_i", 0.0),
-                        "length_off_j": beam.get("length_off_j", 0.0),
-                        "joint_offset_i": beam.get("joint_offset_i", [0, 0, 0]),
-                        "joint_offset_j": beam.get("joint_offset_j", [0, 0, 0]),
-                        "has_joint_offsets": beam.get("has_joint_offsets", False),
-                        "vecxz": [0, 0, 1]  # Beam vector
-                    }
-                    transformation_info["beam_transforms"].append(transform_info)
-
-                    if transform_info["has_joint_offsets"]:
-                        transformation_info["joint_offset_summary"]["beams_with_offsets"] += 1
+                beam_transforms = [
+                    _transform_record(beam, _BEAM_TRANSFORM_FIELDS, BEAM_VECXZ)
+                    for beam in beam_data["beams"]
+                ]
+                transformation_info["beam_transforms"] = beam_transforms
+                transformation_info["joint_offset_summary"]["beams_with_offsets"] = sum(
+                    1 for t in beam_transforms if t["has_joint_offsets"]
+                )
 
             # Analyze column transformations
             if column_data and "columns" in column_data:
-                for column in column_data["columns"]:
-                    transform_info = {
-                        "element_tag": column.get("tag"),
-                        "line": column.get("line"),
-                        "story": column.get("story"),
-                        "transf_tag": column.get("transf_tag"),
-                        "length_off_i": column.get("length_off_i", 0.0),
-                        "length_off_j": column.get("length_off_j", 0.0),
-                        "offsets_i": column.get("offsets_i", {}),
-                        "offsets_j": column.get("offsets_j", {}),
-                        "joint_offset_i": column.get("joint_offset_i", [0, 0, 0]),
-                        "joint_offset_j": column.get("joint_offset_j", [0, 0, 0]),
-                        "has_joint_offsets": column.get("has_joint_offsets", False),
-                        "vecxz": [1, 0, 0]  # Column vector
-                    }
-                    transformation_info["column_transforms"].append(transform_info)
-
-                    if transform_info["has_joint_offsets"]:
-                        transformation_info["joint_offset_summary"]["columns_with_offsets"] += 1
+                column_transforms = [
+                    _transform_record(column, _COLUMN_TRANSFORM_FIELDS, COLUMN_VECXZ)
+                    for column in column_data["columns"]
+                ]
+                transformation_info["column_transforms"] = column_transforms
+                transformation_info["joint_offset_summary"]["columns_with_offsets"] = sum(
+                    1 for t in column_transforms if t["has_joint_offsets"]
+                )
 
             # Calculate totals
             summary = transformation_info["joint_offset_summary"]
@@ -231,61 +448,35 @@ class OpenSeesModelValidator:
 
     def extract_tracking_elements(self) -> Dict[str, Any]:
         """Extract specific tracking elements for detailed inspection."""
+        return self.tracking
+
+    def _compute_tracking_elements(self) -> Dict[str, Any]:
+        """Locate the tracking elements and verify their joint offsets."""
         try:
             print("Extracting tracking elements...")
 
-            tracking_info = {
-                "beam_b408": None,
-                "column_c522": None,
-                "verification_status": {}
-            }
+            tracking_info = {key: None for key, *_ in TRACKED_ELEMENTS}
+            tracking_info["verification_status"] = {}
+            status = tracking_info["verification_status"]
 
-            # Load transformation data
-            transforms = self.extract_geometric_transformations()
-
-            # Find BEAM B408 @ 11_P6
-            for beam in transforms.get("beam_transforms", []):
-                if beam.get("line") == "B408" and beam.get("story") == "11_P6":
-                    tracking_info["beam_b408"] = beam
-                    break
-
-            # Find COLUMN C522 @ 02_P2
-            for column in transforms.get("column_transforms", []):
-                if column.get("line") == "C522" and column.get("story") == "02_P2":
-                    tracking_info["column_c522"] = column
-                    break
-
-            # Verification
-            tracking_info["verification_status"]["beam_b408_found"] = tracking_info["beam_b408"] is not None
-            tracking_info["verification_status"]["column_c522_found"] = tracking_info["column_c522"] is not None
-
-            if tracking_info["beam_b408"]:
-                expected_offset_i = [0.4, 0.0, 0.0]  # LENGTHOFFI = 0.4
-                actual_offset_i = tracking_info["beam_b408"]["joint_offset_i"]
-                tracking_info["verification_status"]["beam_b408_offset_correct"] = (
-                    abs(actual_offset_i[0] - expected_offset_i[0]) < 1e-6 and
-                    abs(actual_offset_i[1] - expected_offset_i[1]) < 1e-6 and
-                    abs(actual_offset_i[2] - expected_offset_i[2]) < 1e-6
-                )
+            # Load transformation data and index it once by (line, story)
+            transforms = self.transforms
+            indexes: Dict[str, Dict[Tuple[Any, Any], Dict[str, Any]]] = {}
 
-            if tracking_info["column_c522"]:
-                # Expected: rigid ends (0.275) + lateral offsets (-0.05, 0.2, 0.0)
-                # dI = (-0.05, 0.2, 0.275), dJ = (-0.05, 0.2, -0.275)
-                expected_offset_i = [-0.05, 0.2, 0.275]
-                expected_offset_j = [-0.05, 0.2, -0.275]
-                actual_offset_i = tracking_info["column_c522"]["joint_offset_i"]
-                actual_offset_j = tracking_info["column_c522"]["joint_offset_j"]
-
-                tracking_info["verification_status"]["column_c522_offset_i_correct"] = (
-                    abs(actual_offset_i[0] - expected_offset_i[0]) < 1e-6 and
-                    abs(actual_offset_i[1] - expected_offset_i[1]) < 1e-6 and
-                    abs(actual_offset_i[2] - expected_offset_i[2]) < 1e-6
-                )
-                tracking_info["verification_status"]["column_c522_offset_j_correct"] = (
-                    abs(actual_offset_j[0] - expected_offset_j[0]) < 1e-6 and
-                    abs(actual_offset_j[1] - expected_offset_j[1]) < 1e-6 and
-                    abs(actual_offset_j[2] - expected_offset_j[2]) < 1e-6
-                )
+            for key, kind, line, story, offset_checks in TRACKED_ELEMENTS:
+                index = indexes.get(kind)
+                if index is None:
+                    index = indexes[kind] = {}
+                    for rec in transforms.get(kind, []):
+                        index.setdefault((rec.get("line"), rec.get("story")), rec)
+
+                element = index.get((line, story))
+                tracking_info[key] = element
+                status[f"{key}_found"] = element is not None
+
+                if element:
+                    for status_key, field, expected in offset_checks:
+                        status[status_key] = _offsets_match(element[field], expected)
 
             return tracking_info
 
@@ -293,7 +484,15 @@ class OpenSeesModelValidator:
             return {"error": f"Failed to extract tracking elements: {e}"}
 
     def run_modal_analysis(self) -> Dict[str, Any]:
-        """Run modal analysis for dynamic properties."""
+        """Run modal analysis for dynamic properties (computed once per loaded model)."""
+        if self.skip_modal:
+            return {"error": "modal skipped by user"}
+        if self._modal_cache is None:
+            self._modal_cache = self._compute_modal_analysis()
+        return self._modal_cache
+
+    def _compute_modal_analysis(self) -> Dict[str, Any]:
+        """Run ops.eigen and derive frequencies, periods and an assessment."""
         try:
             print("Running modal analysis...")
 
@@ -308,15 +507,23 @@ class OpenSeesModelValidator:
             frequencies = []
             periods = []
 
-            for i, eigenval in enumerate(eigenvalues):
-                if eigenval > 0:
-                    freq = (eigenval ** 0.5) / (2 * 3.14159)
-                    period = 1.0 / freq if freq > 0 else float('inf')
-                    frequencies.append(freq)
-                    periods.append(period)
-                else:
-                    frequencies.append(0.0)
-                    periods.append(float('inf'))
+            if NUMPY_AVAILABLE and len(eigenvalues) >= _NUMPY_MIN_MODES:
+                ev = np.asarray(eigenvalues, dtype=np.float64)
+                positive = ev > 0
+                freqs = np.where(positive, np.sqrt(np.clip(ev, 0.0, None)) * _INV_TWO_PI, 0.0)
+                with np.errstate(divide="ignore"):
+                    inv_freqs = 1.0 / freqs
+                frequencies = freqs.tolist()
+                periods = np.where(freqs > 0, inv_freqs, np.inf).tolist()
+            else:
+                for eigenval in eigenvalues:
+                    if eigenval > 0:
+                        freq = math.sqrt(eigenval) * _INV_TWO_PI
+                        frequencies.append(freq)
+                        periods.append(1.0 / freq if freq > 0 else float('inf'))
+                    else:
+                        frequencies.append(0.0)
+                        periods.append(float('inf'))
 
             modal_info = {
                 "num_modes_requested": num_modes,
@@ -349,181 +556,222 @@ class OpenSeesModelValidator:
 
     def generate_text_report(self) -> str:
         """Generate comprehensive text report."""
-        lines = []
-        lines.append("OpenSees Model Validation Report")
-        lines.append("=" * 50)
-        lines.append(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-        lines.append(f"Model File: {self.model_path}")
-        lines.append("")
+        buf = io.StringIO()
+        w = buf.write
+        w("OpenSees Model Validation Report\n")
+        w(_SEP_EQ50)
+        w(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
+        w(f"Model File: {self.model_path}\n")
+        w("\n")
 
         # Model Info
-        lines.append("MODEL INFORMATION")
-        lines.append("-" * 20)
+        w("MODEL INFORMATION\n")
+        w(_SEP_DASH20)
         if self.model_info:
-            lines.append(f"Nodes: {self.model_info.get('nodes', 'N/A')}")
-            lines.append(f"Elements: {self.model_info.get('elements', 'N/A')}")
-            lines.append(f"Dimensions: {self.model_info.get('ndm', 'N/A')}D")
-            lines.append(f"DOF per node: {self.model_info.get('ndf', 'N/A')}")
+            w(f"Nodes: {self.model_info.get('nodes', 'N/A')}\n")
+            w(f"Elements: {self.model_info.get('elements', 'N/A')}\n")
+            w(f"Dimensions: {self.model_info.get('ndm', 'N/A')}D\n")
+            w(f"DOF per node: {self.model_info.get('ndf', 'N/A')}\n")
 
             bounds = self.model_info.get('bounds', {})
             if bounds:
-                lines.append(f"X range: [{bounds['x_range'][0]:.2f}, {bounds['x_range'][1]:.2f}]")
-                lines.append(f"Y range: [{bounds['y_range'][0]:.2f}, {bounds['y_range'][1]:.2f}]")
-                lines.append(f"Z range: [{bounds['z_range'][0]:.2f}, {bounds['z_range'][1]:.2f}]")
-        lines.append("")
+                w(f"X range: [{bounds['x_range'][0]:.2f}, {bounds['x_range'][1]:.2f}]\n")
+                w(f"Y range: [{bounds['y_range'][0]:.2f}, {bounds['y_range'][1]:.2f}]\n")
+                w(f"Z range: [{bounds['z_range'][0]:.2f}, {bounds['z_range'][1]:.2f}]\n")
+        w("\n")
 
         # Test Results
         if self.test_results:
-            lines.append("VALIDATION TEST RESULTS")
-            lines.append("-" * 25)
+            w("VALIDATION TEST RESULTS\n")
+            w(_SEP_DASH25)
 
-            total_tests = sum(suite.total_tests for suite in self.test_results.values())
-            passed_tests = sum(suite.passed_tests for suite in self.test_results.values())
-            lines.append(f"Overall: {passed_tests}/{total_tests} tests passed ({passed_tests/total_tests*100:.1f}%)")
-            lines.append("")
+            total_tests, passed_tests = self._test_totals or self._tally_tests()
+            w(f"Overall: {passed_tests}/{total_tests} tests passed ({passed_tests/total_tests*100:.1f}%)\n")
+            w("\n")
 
             for suite_name, suite in self.test_results.items():
-                lines.append(f"{suite.name}: {suite.passed_tests}/{suite.total_tests} passed ({suite.success_rate:.1f}%)")
+                w(f"{suite.name}: {suite.passed_tests}/{suite.total_tests} passed ({suite.success_rate:.1f}%)\n")
 
                 for result in suite.results:
                     status = "✓" if result.passed else "✗"
-                    lines.append(f"  {status} {result.name}: {result.message}")
-                lines.append("")
+                    w(f"  {status} {result.name}: {result.message}\n")
+                w("\n")
 
         # Geometric Transformations
-        transforms = self.extract_geometric_transformations()
+        transforms = self.transforms
         if "error" not in transforms:
-            lines.append("GEOMETRIC TRANSFORMATIONS")
-            lines.append("-" * 25)
+            w("GEOMETRIC TRANSFORMATIONS\n")
+            w(_SEP_DASH25)
             summary = transforms["joint_offset_summary"]
-            lines.append(f"Total transformations: {summary['total_transforms']}")
-            lines.append(f"Transformations with joint offsets: {summary['total_with_offsets']}")
-            lines.append(f"  - Beams with offsets: {summary['beams_with_offsets']}")
-            lines.append(f"  - Columns with offsets: {summary['columns_with_offsets']}")
-            lines.append("")
+            w(f"Total transformations: {summary['total_transforms']}\n")
+            w(f"Transformations with joint offsets: {summary['total_with_offsets']}\n")
+            w(f"  - Beams with offsets: {summary['beams_with_offsets']}\n")
+            w(f"  - Columns with offsets: {summary['columns_with_offsets']}\n")
+            w("\n")
 
         # Tracking Elements
-        tracking = self.extract_tracking_elements()
+        tracking = self.tracking
         if "error" not in tracking:
-            lines.append("TRACKING ELEMENTS VERIFICATION")
-            lines.append("-" * 30)
+            w("TRACKING ELEMENTS VERIFICATION\n")
+            w(_SEP_DASH30)
 
             status = tracking["verification_status"]
 
             # BEAM B408
-            lines.append("BEAM B408 @ 11_P6:")
+            w("BEAM B408 @ 11_P6:\n")
             if status.get("beam_b408_found"):
-                lines.append("  ✓ Element found")
+                w("  ✓ Element found\n")
                 if status.get("beam_b408_offset_correct"):
-                    lines.append("  ✓ Joint offsets correct")
+                    w("  ✓ Joint offsets correct\n")
                 else:
-                    lines.append("  ✗ Joint offsets incorrect")
+                    w("  ✗ Joint offsets incorrect\n")
                 beam_info = tracking["beam_b408"]
-                lines.append(f"  Joint offset I: {beam_info['joint_offset_i']}")
-                lines.append(f"  Joint offset J: {beam_info['joint_offset_j']}")
+                w(f"  Joint offset I: {beam_info['joint_offset_i']}\n")
+                w(f"  Joint offset J: {beam_info['joint_offset_j']}\n")
             else:
-                lines.append("  ✗ Element not found")
-            lines.append("")
+                w("  ✗ Element not found\n")
+            w("\n")
 
             # COLUMN C522
-            lines.append("COLUMN C522 @ 02_P2:")
+            w("COLUMN C522 @ 02_P2:\n")
             if status.get("column_c522_found"):
-                lines.append("  ✓ Element found")
+                w("  ✓ Element found\n")
                 if status.get("column_c522_offset_i_correct") and status.get("column_c522_offset_j_correct"):
-                    lines.append("  ✓ Joint offsets correct")
+                    w("  ✓ Joint offsets correct\n")
                 else:
-                    lines.append("  ✗ Joint offsets incorrect")
+                    w("  ✗ Joint offsets incorrect\n")
                 col_info = tracking["column_c522"]
-                lines.append(f"  Joint offset I: {col_info['joint_offset_i']}")
-                lines.append(f"  Joint offset J: {col_info['joint_offset_j']}")
+                w(f"  Joint offset I: {col_info['joint_offset_i']}\n")
+                w(f"  Joint offset J: {col_info['joint_offset_j']}\n")
             else:
-                lines.append("  ✗ Element not found")
-            lines.append("")
+                w("  ✗ Element not found\n")
+            w("\n")
 
         # Modal Analysis
-        modal_info = self.run_modal_analysis()
-        if "error" not in modal_info:
-            lines.append("MODAL ANALYSIS")
-            lines.append("-" * 15)
-            lines.append(f"Fundamental frequency: {modal_info.get('fundamental_frequency', 'N/A'):.3f} Hz")
-            lines.append(f"Fundamental period: {modal_info.get('fundamental_period', 'N/A'):.3f} sec")
-            lines.append(f"Assessment: {modal_info.get('structure_assessment', 'N/A')}")
-
-            lines.append("First 6 modes:")
-            for i, (freq, period) in enumerate(zip(modal_info['frequencies'][:6], modal_info['periods'][:6])):
-                lines.append(f"  Mode {i+1}: {freq:.3f} Hz, {period:.3f} sec")
+        if self.skip_modal:
+            w("MODAL ANALYSIS\n")
+            w(_SEP_DASH15)
+            w("Skipped (--skip-modal)\n")
         else:
-            lines.append("MODAL ANALYSIS")
-            lines.append("-" * 15)
-            lines.append(f"Error: {modal_info['error']}")
+            modal_info = self.run_modal_analysis()
+            if "error" not in modal_info:
+                w("MODAL ANALYSIS\n")
+                w(_SEP_DASH15)
+                w(f"Fundamental frequency: {modal_info.get('fundamental_frequency', 'N/A'):.3f} Hz\n")
+                w(f"Fundamental period: {modal_info.get('fundamental_period', 'N/A'):.3f} sec\n")
+                w(f"Assessment: {modal_info.get('structure_assessment', 'N/A')}\n")
+
+                w("First 6 modes:\n")
+                for i, (freq, period) in enumerate(zip(modal_info['frequencies'][:6], modal_info['periods'][:6])):
+                    w(f"  Mode {i+1}: {freq:.3f} Hz, {period:.3f} sec\n")
+            else:
+                w("MODAL ANALYSIS\n")
+                w(_SEP_DASH15)
+                w(f"Error: {modal_info['error']}\n")
 
-        lines.append("")
-        lines.append("End of Report")
-        lines.append("=" * 50)
+        w("\n")
+        w("End of Report\n")
+        w(_SEP_EQ50)
 
-        return "\n".join(lines)
+        # Lines are newline-terminated; the report itself has no trailing newline
+        return buf.getvalue()[:-1]
 
     def _load_artifact(self, filename: str) -> Optional[Dict[str, Any]]:
         """Load JSON artifact data."""
         try:
             artifact_path = PROJECT_ROOT / "out" / filename
             if artifact_path.exists():
-                with open(artifact_path, 'r', encoding='utf-8') as f:
-                    return json.load(f)
+                # Map the file read-only and hand the buffer to the parser in one go
+                with open(artifact_path, 'rb') as f, \
+                        mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    if ORJSON_AVAILABLE:
+                        try:
+                            with memoryview(mm) as view:
+                                return orjson.loads(view)
+                        except orjson.JSONDecodeError:
+                            pass  # e.g. NaN/Infinity written by json.dump; let the stdlib parser decide
+                    return json.loads(mm[:])
         except Exception:
             pass
         return None
 
-    def save_validation_data(self):
-        """Save all validation data to files."""
+    def save_validation_data(self, write_report: bool = True, write_json: bool = True):
+        """Save validation data to files (text report and/or JSON data)."""
         print(f"Saving validation data to: {self.output_dir}")
 
+        # Tracking checks only read JSON artifacts, so a helper thread can load
+        # them while the modal analysis (ops.eigen) runs here; every ops.* call
+        # stays on this thread. The overlap is limited to the file I/O, since
+        # parsing holds the GIL. Both results are cached for the report below.
+        tracking_thread = threading.Thread(target=lambda: self.tracking, daemon=True)
+        tracking_thread.start()
+        modal_info = self.run_modal_analysis()
+        tracking_thread.join()
+        tracking = self.tracking
+
+        created = []
+
         # Text report
-        text_report = self.generate_text_report()
-        with open(self.output_dir / "validation_report.txt", 'w', encoding='utf-8') as f:
-            f.write(text_report)
+        if write_report:
+            text_report = self.generate_text_report()
+            (self.output_dir / "validation_report.txt").write_text(text_report, encoding='utf-8')
+            created.append("validation_report.txt")
 
         # JSON data
-        validation_data = {
-            "model_info": self.model_info,
-            "test_results": self._serialize_test_results(),
-            "geometric_transformations": self.extract_geometric_transformations(),
-            "tracking_elements": self.extract_tracking_elements(),
-            "modal_analysis": self.run_modal_analysis(),
-            "generation_time": datetime.now().isoformat()
-        }
+        if write_json:
+            validation_data = {
+                "model_info": self.model_info,
+                "test_results": self._serialize_test_results(),
+                "geometric_transformations": self.transforms,
+                "tracking_elements": tracking,
+                "modal_analysis": modal_info,
+                "generation_time": datetime.now().isoformat()
+            }
 
-        with open(self.output_dir / "validation_data.json", 'w', encoding='utf-8') as f:
-            json.dump(validation_data, f, indent=2, default=str)
+            json_path = self.output_dir / "validation_data.json"
+            # orjson writes NaN/Infinity as null; json.dump keeps them as the baseline did
+            if ORJSON_AVAILABLE and not _has_non_finite(validation_data):
+                options = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+                json_path.write_bytes(orjson.dumps(validation_data, option=options, default=str))
+            else:
+                json_path.write_text(json.dumps(validation_data, indent=2, default=str), encoding='utf-8')
+            created.append("validation_data.json")
 
         print("Validation files created:")
-        print(f"  - {self.output_dir}/validation_report.txt")
-        print(f"  - {self.output_dir}/validation_data.json")
+        for name in created:
+            print(f"  - {self.output_dir}/{name}")
+
+    @staticmethod
+    def _serialize_suite(suite) -> Dict[str, Any]:
+        """Serialize a single test suite for JSON output."""
+        return {
+            "name": suite.name,
+            "total_tests": suite.total_tests,
+            "passed_tests": suite.passed_tests,
+            "success_rate": suite.success_rate,
+            "results": [
+                {
+                    "name": result.name,
+                    "category": result.category,
+                    "passed": result.passed,
+                    "message": result.message,
+                    "severity": result.severity,
+                    "details": result.details
+                }
+                for result in suite.results
+            ]
+        }
 
     def _serialize_test_results(self) -> Dict[str, Any]:
-        """Serialize test results for JSON output."""
-        serialized = {}
-        for suite_name, suite in self.test_results.items():
-            serialized[suite_name] = {
-                "name": suite.name,
-                "total_tests": suite.total_tests,
-                "passed_tests": suite.passed_tests,
-                "success_rate": suite.success_rate,
-                "results": [
-                    {
-                        "name": result.name,
-                        "category": result.category,
-                        "passed": result.passed,
-                        "message": result.message,
-                        "severity": result.severity,
-                        "details": result.details
-                    }
-                    for result in suite.results
-                ]
-            }
-        return serialized
-
-    def run_full_validation(self) -> bool:
+        """Serialize test results for JSON output (one task per suite)."""
+        if not self.test_results:
+            return {}
+        suite_names = list(self.test_results)
+        with ThreadPoolExecutor(max_workers=min(len(suite_names), os.cpu_count() or 1)) as executor:
+            suites = executor.map(self._serialize_suite, self.test_results.values())
+            return dict(zip(suite_names, suites))
+
+    def run_full_validation(self, write_report: bool = True, write_json: bool = True) -> bool:
         """Run complete validation process."""
         print("OpenSees Model Validator")
         print("=" * 30)
@@ -534,7 +782,7 @@ class OpenSeesModelValidator:
         if not self.run_validation_tests():
             return False
 
-        self.save_validation_data()
+        self.save_validation_data(write_report=write_report, write_json=write_json)
 
         print("\nValidation completed successfully!")
         print(f"Review the generated files in: {self.output_dir}")
@@ -556,6 +804,21 @@ def main():
         default="validation_output",
         help="Output directory for validation files (default: validation_output)"
     )
+    parser.add_argument(
+        "--no-report",
+        action="store_true",
+        help="Skip writing validation_report.txt"
+    )
+    parser.add_argument(
+        "--no-json",
+        action="store_true",
+        help="Skip writing validation_data.json"
+    )
+    parser.add_argument(
+        "--skip-modal",
+        action="store_true",
+        help="Skip the eigenvalue (modal) analysis for quick geometric/tracking checks"
+    )
 
     args = parser.parse_args()
 
@@ -563,9 +826,12 @@ def main():
         print("ERROR: OpenSeesPy not available. Please install: pip install openseespy")
         return 1
 
-    validator = OpenSeesModelValidator(args.model, args.output)
+    validator = OpenSeesModelValidator(args.model, args.output, skip_modal=args.skip_modal)
 
-    success = validator.run_full_validation()
+    success = validator.run_full_validation(
+        write_report=not args.no_report,
+        write_json=not args.no_json,
+    )
     return 0 if success else 1
 
 
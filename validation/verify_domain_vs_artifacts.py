@@ -13,25 +13,92 @@ Includes robust write with retry/fallback to avoid Windows file locks.
 from __future__ import annotations
 
 import argparse
+import functools
+import hashlib
+import heapq
+import importlib
+import importlib.util
+import itertools
 import json
 import os
+import sys
 import time
-from typing import Any, Dict, List, Tuple, Set
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Container, Dict, Iterable, List, Tuple, Set
 
-from src.utilities.ops_capture import capture_session, get_capture, save_capture
+from src.utilities.ops_capture import capture_session, get_capture, get_element_pairs, save_capture
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
 
 
 TOL = 1e-6
 # Rigid diaphragm master fix pattern from repo spec: fix(master, 0,0,1,1,1,0)
 DIAPH_FIX = (0, 0, 1, 1, 1, 0)
+_DOF_KEYS = ("ux", "uy", "uz", "rx", "ry", "rz")
+# Canonical instances of 6-DOF fix tuples; only a handful of patterns recur
+_FIX_TUPLES: Dict[Tuple[int, ...], Tuple[int, ...]] = {}
+# MODEL_translator module, imported on first use (see _get_translator)
+_TRANSLATOR = None
+# Below this many rows the scalar comparisons beat building NumPy arrays
+_NUMPY_MIN_ROWS = 256
+# Artifacts at least this large are streamed with ijson when it is installed.
+# Streaming is about 2x slower than the cached orjson parse but peaks near 3x the
+# file size instead of ~9x, which only pays off for very large models.
+_STREAM_MIN_BYTES = 32 * 1024 * 1024
+
+
+@functools.lru_cache(maxsize=32)
+def _load_json_cached(path: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+    # mtime_ns/size only key the cache: an edited artifact is parsed again
+    try:
+        with open(path, "rb") as f:
+            raw = f.read()
+        if ORJSON_AVAILABLE:
+            try:
+                return orjson.loads(raw)
+            except orjson.JSONDecodeError:
+                pass  # e.g. NaN/Infinity written by json.dump; let the stdlib parser decide
+        return json.loads(raw)
+    except Exception:
+        return {}
+
+
+def _dump_json_bytes(data: Dict[str, Any]) -> bytes:
+    """Serialize to indented JSON bytes, via orjson when it can encode the data."""
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+        except orjson.JSONEncodeError:
+            pass
+    return json.dumps(data, indent=2).encode("utf-8")
 
 
 def _load_json(path: str) -> Dict[str, Any]:
+    """
+    Parse an artifact, reusing the previous parse while the file is unchanged.
+    The returned dict may be shared between calls; treat it as read-only.
+    """
     try:
-        with open(path, "r", encoding="utf-8") as f:
-            return json.load(f)
-    except Exception:
+        st = os.stat(path)
+    except OSError:
         return {}
+    return _load_json_cached(path, st.st_mtime_ns, st.st_size)
 
 
 def _safe_write_json(path: str, data: Dict[str, Any], *, attempts: int = 6, delay: float = 0.25) -> str:
@@ -39,12 +106,18 @@ def _safe_write_json(path: str, data: Dict[str, Any], *, attempts: int = 6, dela
     Write JSON to 'path' using a temp file and atomic replace. On Windows, if the
     target is locked by another process, retry a few times; if still failing,
     fall back to a unique filename with PID suffix. Returns the actual file path.
+    POSIX has no such locks, so the replace is attempted once without sleeping.
     """
     path = str(path)
     os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
     tmp = f"{path}.tmp.{os.getpid()}"
-    with open(tmp, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2)
+    payload = _dump_json_bytes(data)
+    with open(tmp, "wb") as f:
+        f.write(payload)
+        f.flush()
+        os.fsync(f.fileno())
+    if os.name != "nt":
+        attempts = 1
     # Try to replace with retries
     for i in range(attempts):
         try:
@@ -56,8 +129,8 @@ def _safe_write_json(path: str, data: Dict[str, Any], *, attempts: int = 6, dela
             time.sleep(delay)
     # Fallback: unique name
     fallback = path.replace(".json", f".{os.getpid()}.json")
-    with open(fallback, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2)
+    with open(fallback, "wb") as f:
+        f.write(payload)
     print(f"[WARN] Could not overwrite locked file: {path}. Wrote fallback: {fallback}")
     # Best-effort cleanup of tmp
     try:
@@ -68,6 +141,25 @@ def _safe_write_json(path: str, data: Dict[str, Any], *, attempts: int = 6, dela
     return fallback
 
 
+def _diff_stats(a: Iterable[Any], b: Container[Any], k: int = 10) -> Tuple[int, List[Any]]:
+    """
+    Count the items of 'a' that are not in 'b' and return (count, k smallest of them),
+    without materializing and sorting the full difference.
+    """
+    count = 0
+
+    def missing() -> Iterable[Any]:
+        nonlocal count
+        for x in a:
+            if x not in b:
+                count += 1
+                yield x
+
+    # nsmallest drains the generator while holding at most k items
+    smallest = heapq.nsmallest(k, missing())
+    return count, smallest
+
+
 def _nodes_dict(nodes_json: Dict[str, Any]) -> Dict[int, Tuple[float, float, float]]:
     out: Dict[int, Tuple[float, float, float]] = {}
     for n in nodes_json.get("nodes", []):
@@ -79,160 +171,339 @@ def _nodes_dict(nodes_json: Dict[str, Any]) -> Dict[int, Tuple[float, float, flo
     return out
 
 
+def _stream_artifact(path: str) -> bool:
+    """True when 'path' is large enough to be streamed rather than parsed whole."""
+    if not IJSON_AVAILABLE:
+        return False
+    try:
+        return os.path.getsize(path) >= _STREAM_MIN_BYTES
+    except OSError:
+        return False
+
+
+def _nodes_from_path(path: str) -> Dict[int, Tuple[float, float, float]]:
+    """
+    tag -> (x, y, z) from nodes.json. Very large files are streamed with ijson
+    straight into the map; otherwise the cached parse is reused.
+    """
+    if not _stream_artifact(path):
+        return _nodes_dict(_load_json(path))
+    out: Dict[int, Tuple[float, float, float]] = {}
+    try:
+        with open(path, "rb") as f:
+            for n in ijson.items(f, "nodes.item"):
+                try:
+                    out[int(n["tag"])] = (float(n["x"]), float(n["y"]), float(n["z"]))
+                except Exception:
+                    continue
+    except Exception:
+        # Missing or malformed file (e.g. NaN literals): same outcome as the non-streaming path
+        return _nodes_dict(_load_json(path))
+    return out
+
+
+def _intern_fix(tpl: Tuple[int, ...]) -> Tuple[int, ...]:
+    """Return the shared instance of a fix tuple, so repeats cost no new allocation
+    and compare by identity first."""
+    return _FIX_TUPLES.setdefault(tpl, tpl)
+
+
+def _xyz_rows(coords: Dict[int, Tuple[float, float, float]], tags: List[int]) -> np.ndarray:
+    """(N, 3) float64 array of coords[tag] for tags, filled straight from the tuples."""
+    n = len(tags)
+    flat = itertools.chain.from_iterable(coords[t] for t in tags)
+    return np.fromiter(flat, dtype=np.float64, count=3 * n).reshape(n, 3)
+
+
 def _supports_dict(supports_json: Dict[str, Any]) -> Dict[int, Tuple[int, int, int, int, int, int]]:
     out: Dict[int, Tuple[int, int, int, int, int, int]] = {}
     for r in supports_json.get("applied", []):
         try:
             tag = int(r["node"])
-            out[tag] = (
+            out[tag] = _intern_fix((
                 int(r.get("ux", 0)),
                 int(r.get("uy", 0)),
                 int(r.get("uz", 0)),
                 int(r.get("rx", 0)),
                 int(r.get("ry", 0)),
                 int(r.get("rz", 0)),
-            )
+            ))
         except Exception:
             continue
     return out
 
 
-def _diaphragms_dict(diaphragms_json: Dict[str, Any]) -> Dict[int, Set[int]]:
+def _diaphragm_tables(
+    diaphragms_json: Dict[str, Any],
+) -> Tuple[Dict[int, Set[int]], Dict[int, Tuple[int, int, int, int, int, int]], Dict[int, Tuple[float, float]]]:
     """
-    Map master -> set(slaves) from artifacts (perp is always 3 by spec).
+    Single pass over diaphragms.json returning:
+      - master -> set(slaves) (perp is always 3 by spec)
+      - master -> fix tuple, only where fix.applied == True. If flags are
+        omitted, 'applied' must still be True and unspecified fields take the
+        repo spec defaults (0,0,1,1,1,0).
+      - master -> (M, Izz), only where mass.applied == True.
     """
-    out: Dict[int, Set[int]] = {}
+    slaves_map: Dict[int, Set[int]] = {}
+    fix_spec: Dict[int, Tuple[int, int, int, int, int, int]] = {}
+    mass_spec: Dict[int, Tuple[float, float]] = {}
     for d in diaphragms_json.get("diaphragms", []):
         try:
             m = int(d["master"])
-            slaves = set(int(s) for s in d.get("slaves", []))
-            out[m] = slaves
+            slaves_map[m] = set(int(s) for s in d.get("slaves", []))
         except Exception:
-            continue
-    return out
-
+            pass
 
-def _diaphragm_fix_spec(diaphragms_json: Dict[str, Any]) -> Dict[int, Tuple[int, int, int, int, int, int]]:
+        fx = d.get("fix") or {}
+        if fx.get("applied"):
+            try:
+                mtag = int(d["master"])
+            except Exception:
+                mtag = None
+            if mtag is not None:
+                # Emitters write all six flags; fall back to spec defaults otherwise
+                try:
+                    fix_spec[mtag] = (
+                        int(fx["ux"]), int(fx["uy"]), int(fx["uz"]),
+                        int(fx["rx"]), int(fx["ry"]), int(fx["rz"]),
+                    )
+                except KeyError:
+                    fix_spec[mtag] = tuple(int(fx.get(k, dflt)) for k, dflt in zip(_DOF_KEYS, DIAPH_FIX))
+
+        ms = d.get("mass")
+        if ms and ms.get("applied"):
+            try:
+                mass_spec[int(d["master"])] = (float(ms["M"]), float(ms["Izz"]))
+            except Exception:
+                pass
+    return slaves_map, fix_spec, mass_spec
+
+
+def _add_element_records(
+    recs: Iterable[Dict[str, Any]], pairs: Set[Tuple[int, int]], tags: Set[int]
+) -> None:
     """
-    master -> fix tuple from artifacts, but only where fix.applied == True.
-    If flags are omitted, we still require 'applied' to be True, and we fill
-    unspecified fields with the repo spec defaults (0,0,1,1,1,0).
+    Add undirected endpoint pairs and transform tags of element records to
+    'pairs' and 'tags' in a single traversal.
     """
-    out: Dict[int, Tuple[int, int, int, int, int, int]] = {}
-    for d in diaphragms_json.get("diaphragms", []):
-        fx = d.get("fix") or {}
-        if not fx.get("applied"):
-            continue
+    for e in recs:
         try:
-            mtag = int(d["master"])
+            i = int(e["i_node"]); j = int(e["j_node"])
+            pairs.add((i, j) if i <= j else (j, i))
         except Exception:
-            continue
-        tpl = (
-            int(fx.get("ux", 0)),
-            int(fx.get("uy", 0)),
-            int(fx.get("uz", 1)),
-            int(fx.get("rx", 1)),
-            int(fx.get("ry", 1)),
-            int(fx.get("rz", 0)),
-        )
-        out[mtag] = tpl
-    return out
+            pass
+        v = e.get("transf_tag")
+        if v is not None:
+            try:
+                tags.add(int(v))
+            except Exception:
+                pass
 
 
-def _master_mass_spec(diaphragms_json: Dict[str, Any]) -> Dict[int, Tuple[float, float]]:
+def _element_tables(*json_blobs: Dict[str, Any]) -> Tuple[Set[Tuple[int, int]], Set[int]]:
     """
-    master -> (M, Izz) from artifacts for stories where 'applied'==True.
+    (endpoint pairs, transform tags) from beams/columns artifacts.
     """
-    out: Dict[int, Tuple[float, float]] = {}
-    for d in diaphragms_json.get("diaphragms", []):
-        if not (d.get("mass") and d["mass"].get("applied")):
-            continue
+    pairs: Set[Tuple[int, int]] = set()
+    tags: Set[int] = set()
+    for blob in json_blobs:
+        for k in ("beams", "columns"):
+            _add_element_records(blob.get(k, []) or [], pairs, tags)
+    return pairs, tags
+
+
+def _element_tables_from_path(path: str, key: str) -> Tuple[Set[Tuple[int, int]], Set[int]]:
+    """
+    Like _element_tables for one artifact file. Very large files have their
+    '<key>' records streamed with ijson; otherwise the cached parse is reused.
+    """
+    if _stream_artifact(path):
+        pairs: Set[Tuple[int, int]] = set()
+        tags: Set[int] = set()
         try:
-            mtag = int(d["master"])
-            M = float(d["mass"]["M"])
-            Izz = float(d["mass"]["Izz"])
-            out[mtag] = (M, Izz)
+            with open(path, "rb") as f:
+                _add_element_records(ijson.items(f, f"{key}.item"), pairs, tags)
+            return pairs, tags
         except Exception:
+            pass  # missing or malformed file: fall back to the non-streaming path
+    return _element_tables(_load_json(path))
+
+
+def _get_translator():
+    """
+    Import MODEL_translator once and keep it for later verifications.
+
+    The first call must happen inside capture_session(): the translator and the
+    src.model_building modules bind OpenSees functions by name at import time, so
+    they have to be imported while the capture wrappers are installed.
+    """
+    global _TRANSLATOR
+    if _TRANSLATOR is None:
+        _TRANSLATOR = importlib.import_module("MODEL_translator")
+    return _TRANSLATOR
+
+
+def _file_stamps(paths: Iterable[str]) -> List[Tuple[str, int, int]]:
+    out: List[Tuple[str, int, int]] = []
+    for path in paths:
+        try:
+            st = os.stat(path)
+        except OSError:
             continue
+        out.append((path, st.st_mtime_ns, st.st_size))
     return out
 
 
-def _union_element_pairs(*json_blobs: Dict[str, Any]) -> Set[Tuple[int, int]]:
+def _source_stamps() -> List[Tuple[str, int, int]]:
+    """Stamps of MODEL_translator and the project sources under src/, located without importing them."""
+    files = []
+    try:
+        spec = importlib.util.find_spec("MODEL_translator")
+    except (ImportError, ValueError):
+        spec = None
+    if spec is not None and spec.origin:
+        files.append(spec.origin)
+    src_pkg = sys.modules.get("src")
+    for root in getattr(src_pkg, "__path__", []):
+        for dirpath, dirnames, filenames in os.walk(root):
+            dirnames[:] = sorted(d for d in dirnames if d != "__pycache__")
+            files.extend(os.path.join(dirpath, n) for n in sorted(filenames) if n.endswith(".py"))
+    return _file_stamps(files)
+
+
+def _artifact_stamps(artifacts_dir_str: str) -> List[Tuple[str, int, int]]:
     """
-    Create set of undirected element endpoint pairs from beams/columns artifacts.
+    Stamps of the JSON artifacts, excluding the verify_* reports. domain_capture.json
+    is included, so a missing or rewritten capture invalidates a saved report.
     """
-    pairs: Set[Tuple[int, int]] = set()
-    for blob in json_blobs:
-        for k in ("beams", "columns"):
-            for e in blob.get(k, []) or []:
-                try:
-                    i = int(e["i_node"]); j = int(e["j_node"])
-                    a, b = (i, j) if i <= j else (j, i)
-                    pairs.add((a, b))
-                except Exception:
-                    continue
-    return pairs
+    try:
+        names = sorted(os.listdir(artifacts_dir_str))
+    except OSError:
+        names = []
+    return _file_stamps(
+        os.path.join(artifacts_dir_str, n) for n in names
+        if n.endswith(".json") and not n.startswith("verify_")
+    )
 
 
-def _transf_tags(*json_blobs: Dict[str, Any]) -> Set[int]:
-    tags: Set[int] = set()
-    for blob in json_blobs:
-        for k in ("beams", "columns"):
-            for e in blob.get(k, []) or []:
-                v = e.get("transf_tag")
-                if v is not None:
-                    try:
-                        tags.add(int(v))
-                    except Exception:
-                        continue
-    return tags
+def _input_signature(stage: str, strict: bool, sources: List[Tuple[str, int, int]],
+                     artifacts: List[Tuple[str, int, int]]) -> str:
+    h = hashlib.blake2b(digest_size=16)
+    h.update(repr((stage, bool(strict), sources, artifacts)).encode("utf-8"))
+    return h.hexdigest()
+
 
+def _print_summary(report: Dict[str, Any], final_path: str) -> None:
+    print("=== Runtime vs Artifacts Verification ===")
+    print(f"Summary: {report['summary']}")
+    print(f"Artifacts dir: {report['artifacts_dir']}")
+    print(f"Report: {final_path}")
+    print("\nChecks:")
+    for name, res in report["checks"].items():
+        det = res.get("details", [])
+        if isinstance(det, list):
+            det = "; ".join(det)
+        print(f" - {name}: {res['status']}  ({det})")
 
-def compare_runtime_vs_artifacts(artifacts_dir: str, stage: str = "all", strict: bool = False) -> Dict[str, Any]:
+
+def compare_runtime_vs_artifacts(
+    artifacts_dir: str, stage: str = "all", strict: bool = False, *, force: bool = False
+) -> Dict[str, Any]:
+    """
+    Build the model under capture and compare it with the artifacts.
+
+    The report is stamped with a signature of (stage, strict, translator/src.*
+    sources, artifact and capture mtimes and sizes). When the previous report carries the same
+    signature nothing has changed, so it is returned without rebuilding; pass
+    force=True to rebuild regardless.
+    """
     artifacts_dir_str = str(artifacts_dir)
+    out_path = os.path.join(artifacts_dir_str, "verify_runtime_report.json")
+
+    # Sources don't change during the build; artifacts may (the build emits some)
+    sources = _source_stamps()
+    if not force:
+        sig = _input_signature(stage, strict, sources, _artifact_stamps(artifacts_dir_str))
+        try:
+            with open(out_path, "rb") as f:
+                prev = json.loads(f.read())
+        except Exception:
+            prev = None
+        if isinstance(prev, dict) and prev.get("_sig") == sig:
+            print("[VERIFY] Inputs unchanged since last report; reusing it (use --force to rebuild)")
+            _print_summary(prev, out_path)
+            return prev
 
     # Build under capture
     with capture_session():
-        import importlib
-        M = importlib.import_module("MODEL_translator")
+        M = _get_translator()
         M.build_model(stage)
 
     cap = get_capture()
     save_capture(artifacts_dir_str)
 
-    # Load artifacts
-    nodes_json = _load_json(os.path.join(artifacts_dir_str, "nodes.json"))
-    supports_json = _load_json(os.path.join(artifacts_dir_str, "supports.json"))
-    diaph_json = _load_json(os.path.join(artifacts_dir_str, "diaphragms.json"))
-    cols_json = _load_json(os.path.join(artifacts_dir_str, "columns.json"))
-    beams_json = _load_json(os.path.join(artifacts_dir_str, "beams.json"))
+    # Runtime lookups, built once from the capture and shared by the checks below
+    nodes_cap = {int(n["tag"]): (float(n["x"]), float(n["y"]), float(n["z"])) for n in cap["nodes"]}
+    cap_fix_map = {
+        int(f["node"]): _intern_fix((f["ux"], f["uy"], f["uz"], f["rx"], f["ry"], f["rz"])) for f in cap["fixes"]
+    }
+    cap_pairs = get_element_pairs()
+
+    # Load artifacts. build_model() may (re)write them, so this waits for the build;
+    # the reads themselves are independent and overlap in worker threads.
+    def _art(name: str) -> str:
+        return os.path.join(artifacts_dir_str, name)
+
+    with ThreadPoolExecutor(max_workers=5) as ex:
+        nodes_fut = ex.submit(_nodes_from_path, _art("nodes.json"))
+        supports_fut = ex.submit(_load_json, _art("supports.json"))
+        diaph_fut = ex.submit(_load_json, _art("diaphragms.json"))
+        beams_fut = ex.submit(_element_tables_from_path, _art("beams.json"), "beams")
+        cols_fut = ex.submit(_element_tables_from_path, _art("columns.json"), "columns")
+    nodes_art = nodes_fut.result()
+    supports_json = supports_fut.result()
+    diaph_json = diaph_fut.result()
+    beam_pairs, beam_transf = beams_fut.result()
+    col_pairs, col_transf = cols_fut.result()
 
     report: Dict[str, Any] = {"artifacts_dir": artifacts_dir_str, "checks": {}}
 
     # --- nodes_set & coords ---
-    nodes_art = _nodes_dict(nodes_json)
-    nodes_cap = {int(n["tag"]): (float(n["x"]), float(n["y"]), float(n["z"])) for n in cap["nodes"]}
-    art_tags = set(nodes_art.keys())
-    cap_tags = set(nodes_cap.keys())
-    missing_in_cap = sorted(list(art_tags - cap_tags))
-    extra_in_cap = sorted(list(cap_tags - art_tags))
-
-    coords_mismatch = []
-    for tag in sorted(art_tags & cap_tags):
-        xa, ya, za = nodes_art[tag]
-        xc, yc, zc = nodes_cap[tag]
-        if abs(xa - xc) > TOL or abs(ya - yc) > TOL or abs(za - zc) > TOL:
-            if len(coords_mismatch) < 10:
-                coords_mismatch.append({"tag": tag, "art": [xa, ya, za], "cap": [xc, yc, zc]})
+    # Key views support len/in/&/- directly, so no key sets are copied
+    art_tags = nodes_art.keys()
+    cap_tags = nodes_cap.keys()
+    n_missing_in_cap, missing_in_cap = _diff_stats(art_tags, cap_tags)
+    n_extra_in_cap, extra_in_cap = _diff_stats(cap_tags, art_tags)
+
+    # Samples below are (key, art, cap) tuples; JSON-shaped dicts are built in the report
+    coords_mismatch: List[Tuple[int, Tuple[float, float, float], Tuple[float, float, float]]] = []
+    common_tags = art_tags & cap_tags
+    if NUMPY_AVAILABLE and len(common_tags) >= _NUMPY_MIN_ROWS:
+        common_tags = sorted(common_tags)
+        xyz_art = _xyz_rows(nodes_art, common_tags)
+        xyz_cap = _xyz_rows(nodes_cap, common_tags)
+        bad_rows = np.flatnonzero((np.abs(xyz_art - xyz_cap) > TOL).any(axis=1))[:10].tolist()
+        for r in bad_rows:
+            tag = common_tags[r]
+            coords_mismatch.append((tag, nodes_art[tag], nodes_cap[tag]))
+    else:
+        def _coords_differ(tag: int) -> bool:
+            xa, ya, za = nodes_art[tag]
+            xc, yc, zc = nodes_cap[tag]
+            return abs(xa - xc) > TOL or abs(ya - yc) > TOL or abs(za - zc) > TOL
+
+        # Only the 10 smallest mismatching tags are reported; no need to sort them all
+        for tag in heapq.nsmallest(10, filter(_coords_differ, common_tags)):
+            coords_mismatch.append((tag, nodes_art[tag], nodes_cap[tag]))
 
     status = "pass"
     details = [f"art={len(art_tags)}, cap={len(cap_tags)}"]
-    if missing_in_cap:
+    if n_missing_in_cap:
         status = "fail" if strict else "warn"
-        details.append(f"{len(missing_in_cap)} node(s) in artifacts missing in runtime")
-    if extra_in_cap:
+        details.append(f"{n_missing_in_cap} node(s) in artifacts missing in runtime")
+    if n_extra_in_cap:
         status = "warn" if status == "pass" else status
-        details.append(f"{len(extra_in_cap)} extra node(s) present in runtime not in artifacts")
+        details.append(f"{n_extra_in_cap} extra node(s) present in runtime not in artifacts")
     if coords_mismatch:
         status = "fail" if strict else "warn"
         details.append(f"{len(coords_mismatch)} node coord mismatch (sample shown)")
@@ -240,54 +511,55 @@ def compare_runtime_vs_artifacts(artifacts_dir: str, stage: str = "all", strict:
     report["checks"]["nodes_set"] = {
         "status": status,
         "details": details,
-        "missing_in_runtime_sample": missing_in_cap[:10],
-        "extra_in_runtime_sample": extra_in_cap[:10],
-        "coord_mismatch_sample": coords_mismatch,
+        "missing_in_runtime_sample": missing_in_cap,
+        "extra_in_runtime_sample": extra_in_cap,
+        "coord_mismatch_sample": [{"tag": t, "art": list(a), "cap": list(c)} for t, a, c in coords_mismatch],
     }
 
     # --- supports ---
     sup_art = _supports_dict(supports_json)
-    sup_cap_all = {int(f["node"]): (f["ux"], f["uy"], f["uz"], f["rx"], f["ry"], f["rz"]) for f in cap["fixes"]}
+    sup_cap_all = cap_fix_map
 
     # Identify diaphragm masters to filter them out of the supports comparison
-    dia_art = _diaphragms_dict(diaph_json)  # master -> slaves
-    dia_masters = set(dia_art.keys())
+    # (fix/mass specs come from the same pass; IMPORTANT: all use diaph_json)
+    dia_art, fx_spec, mass_spec = _diaphragm_tables(diaph_json)
 
     # Remove captured fixes on diaphragm masters if they match the diaphragm fix pattern
+    # (master, DIAPH_FIX) pairs: one hashed probe per captured fix
+    diaph_fix_keys = frozenset((m, DIAPH_FIX) for m in dia_art)
     sup_cap = {
         n: tpl for n, tpl in sup_cap_all.items()
-        if not (n in dia_masters and tpl == DIAPH_FIX)
+        if (n, tpl) not in diaph_fix_keys
     }
 
     # Now compare only supports listed in artifacts
-    missing_supports = sorted(list(set(sup_art.keys()) - set(sup_cap.keys())))
+    n_missing_supports, missing_supports = _diff_stats(sup_art, sup_cap)
     # "extra" supports are those present at runtime but not listed in supports.json,
     # AFTER excluding diaphragm master fixities
-    extra_supports = sorted(list(set(sup_cap.keys()) - set(sup_art.keys())))
+    n_extra_supports, extra_supports = _diff_stats(sup_cap, sup_art)
 
-    mismatched = []
-    for node in sorted(set(sup_art.keys()) & set(sup_cap.keys())):
-        if sup_art[node] != sup_cap[node]:
-            if len(mismatched) < 10:
-                mismatched.append({"node": node, "art": sup_art[node], "cap": sup_cap[node]})
+    mismatched = [
+        (node, sup_art[node], sup_cap[node])
+        for node in heapq.nsmallest(10, (n for n in sup_art.keys() & sup_cap.keys() if sup_art[n] != sup_cap[n]))
+    ]
 
     status = "pass"
     details = [f"art={len(sup_art)}, cap={len(sup_cap_all)} (filtered cap for supports compare={len(sup_cap)})"]
-    if missing_supports:
+    if n_missing_supports:
         status = "fail" if strict else "warn"
-        details.append(f"{len(missing_supports)} supports missing in runtime")
-    if extra_supports:
+        details.append(f"{n_missing_supports} supports missing in runtime")
+    if n_extra_supports:
         status = "warn" if status == "pass" else status
-        details.append(f"{len(extra_supports)} extra supports present in runtime (non-diaphragm)")
+        details.append(f"{n_extra_supports} extra supports present in runtime (non-diaphragm)")
     if mismatched:
         status = "fail" if strict else "warn"
         details.append(f"{len(mismatched)} support flag mismatch (sample shown)")
     report["checks"]["supports"] = {
         "status": status,
         "details": details,
-        "missing_in_runtime_sample": missing_supports[:10],
-        "extra_in_runtime_sample": extra_supports[:10],
-        "mismatch_sample": mismatched,
+        "missing_in_runtime_sample": missing_supports,
+        "extra_in_runtime_sample": extra_supports,
+        "mismatch_sample": [{"node": n, "art": a, "cap": c} for n, a, c in mismatched],
     }
 
     # --- diaphragms ---
@@ -304,48 +576,43 @@ def compare_runtime_vs_artifacts(artifacts_dir: str, stage: str = "all", strict:
         else:
             dia_cap_map[m] = slaves
 
-    missing_masters = sorted(list(set(dia_art.keys()) - set(dia_cap_map.keys())))
-    extra_masters = sorted(list(set(dia_cap_map.keys()) - set(dia_art.keys())))
-    slave_mismatches = []
-    for m in sorted(set(dia_art.keys()) & set(dia_cap_map.keys())):
-        a = dia_art[m]
-        c = dia_cap_map[m]
-        if a != c:
-            if len(slave_mismatches) < 10:
-                slave_mismatches.append({"master": m, "art_diff": sorted(list(a ^ c))})
-
-    # Master fixity validation (IMPORTANT: use diaph_json here)
-    fx_spec = _diaphragm_fix_spec(diaph_json)  # only where fix.applied == True
-    cap_fix_map = {int(f["node"]): (f["ux"], f["uy"], f["uz"], f["rx"], f["ry"], f["rz"]) for f in cap["fixes"]}
-
-    missing_fix = []
-    fix_mismatch = []
-    for m, spec_tpl in fx_spec.items():
-        if m not in cap_fix_map:
-            missing_fix.append(m)
-        else:
-            cap_tpl = cap_fix_map[m]
-            if cap_tpl != spec_tpl:
-                if len(fix_mismatch) < 10:
-                    fix_mismatch.append({"master": m, "cap": cap_tpl, "spec": spec_tpl})
+    n_missing_masters, missing_masters = _diff_stats(dia_art, dia_cap_map)
+    n_extra_masters, extra_masters = _diff_stats(dia_cap_map, dia_art)
+    # Length check first: most masters match, and differing sizes need no hashing
+    bad_masters = heapq.nsmallest(10, (
+        m for m in dia_art.keys() & dia_cap_map.keys()
+        if len(dia_art[m]) != len(dia_cap_map[m]) or dia_art[m] != dia_cap_map[m]
+    ))
+    slave_mismatches = [(m, dia_art[m] ^ dia_cap_map[m]) for m in bad_masters]
+
+    # Master fixity validation (fx_spec: only where fix.applied == True)
+
+    # Samples are drawn lazily and stop after 10; only the missing count needs a full pass
+    n_missing_fix = sum(1 for m in fx_spec if m not in cap_fix_map)
+    missing_fix = list(itertools.islice((m for m in fx_spec if m not in cap_fix_map), 10))
+    fix_mismatch = list(itertools.islice((
+        (m, cap_fix_map[m], spec_tpl)
+        for m, spec_tpl in fx_spec.items()
+        if m in cap_fix_map and cap_fix_map[m] != spec_tpl
+    ), 10))
 
     status = "pass"
     details = [f"masters art={len(dia_art)}, cap={len(dia_cap_map)}"]
     if perp_violations:
         status = "fail" if strict else "warn"
         details.append(f"{len(perp_violations)} rigidDiaphragm perp!=3")
-    if missing_masters:
+    if n_missing_masters:
         status = "fail" if strict else "warn"
-        details.append(f"{len(missing_masters)} master(s) missing in runtime")
-    if extra_masters:
+        details.append(f"{n_missing_masters} master(s) missing in runtime")
+    if n_extra_masters:
         status = "warn" if status == "pass" else status
-        details.append(f"{len(extra_masters)} extra master(s) present in runtime")
+        details.append(f"{n_extra_masters} extra master(s) present in runtime")
     if slave_mismatches:
         status = "fail" if strict else "warn"
         details.append(f"{len(slave_mismatches)} master(s) with slave set mismatch (sample shown)")
-    if missing_fix:
+    if n_missing_fix:
         status = "fail" if strict else "warn"
-        details.append(f"{len(missing_fix)} master(s) missing required diaphragm fixity")
+        details.append(f"{n_missing_fix} master(s) missing required diaphragm fixity")
     if fix_mismatch:
         status = "fail" if strict else "warn"
         details.append(f"{len(fix_mismatch)} master(s) with diaphragm fix mismatch (sample shown)")
@@ -353,82 +620,84 @@ def compare_runtime_vs_artifacts(artifacts_dir: str, stage: str = "all", strict:
         "status": status,
         "details": details,
         "perp_violations_sample": perp_violations[:3],
-        "missing_masters_sample": missing_masters[:10],
-        "extra_masters_sample": extra_masters[:10],
-        "slave_mismatch_sample": slave_mismatches,
-        "missing_fix_sample": missing_fix[:10],
-        "fix_mismatch_sample": fix_mismatch,
+        "missing_masters_sample": missing_masters,
+        "extra_masters_sample": extra_masters,
+        "slave_mismatch_sample": [{"master": m, "art_diff": sorted(d)} for m, d in slave_mismatches],
+        "missing_fix_sample": missing_fix,
+        "fix_mismatch_sample": [{"master": m, "cap": c, "spec": sp} for m, c, sp in fix_mismatch],
     }
 
     # --- master masses ---
-    mass_spec = _master_mass_spec(diaph_json)  # mtag -> (M, Izz)
     mass_cap = {int(m["node"]): [float(x) for x in m["m"]] for m in cap["masses"]}
-    missing_mass = sorted(list(set(mass_spec.keys()) - set(mass_cap.keys())))
+    n_missing_mass, missing_mass = _diff_stats(mass_spec, mass_cap)
     bad_mass = []
-    for mtag, (M, Izz) in mass_spec.items():
-        if mtag not in mass_cap:
-            continue
-        v = mass_cap[mtag]
-        ok = (
-            abs(v[0] - M) <= TOL
-            and abs(v[1] - M) <= TOL
-            and abs(v[2] - 0.0) <= TOL
-            and abs(v[3] - 0.0) <= TOL
-            and abs(v[4] - 0.0) <= TOL
-            and abs(v[5] - Izz) <= TOL
-        )
-        if not ok and len(bad_mass) < 10:
-            bad_mass.append({"node": mtag, "cap": v, "spec": [M, M, 0.0, 0.0, 0.0, Izz]})
+    mass_rows = [(mtag, [M, M, 0.0, 0.0, 0.0, Izz]) for mtag, (M, Izz) in mass_spec.items() if mtag in mass_cap]
+    if NUMPY_AVAILABLE and len(mass_rows) >= _NUMPY_MIN_ROWS:
+        m_cap = np.array([mass_cap[mtag][:6] for mtag, _ in mass_rows], dtype=np.float64)
+        m_spec = np.array([spec for _, spec in mass_rows], dtype=np.float64)
+        bad_rows = np.flatnonzero(~(np.abs(m_cap - m_spec) <= TOL).all(axis=1))[:10].tolist()
+        for r in bad_rows:
+            mtag, spec = mass_rows[r]
+            bad_mass.append((mtag, mass_cap[mtag], spec))
+    else:
+        def _mass_ok(row: Tuple[int, List[float]]) -> bool:
+            mtag, spec = row
+            v = mass_cap[mtag]
+            M, Izz = spec[0], spec[5]
+            return (
+                abs(v[0] - M) <= TOL
+                and abs(v[1] - M) <= TOL
+                and abs(v[2] - 0.0) <= TOL
+                and abs(v[3] - 0.0) <= TOL
+                and abs(v[4] - 0.0) <= TOL
+                and abs(v[5] - Izz) <= TOL
+            )
+
+        # Stop scanning once 10 mismatching masters are found
+        for mtag, spec in itertools.islice(itertools.filterfalse(_mass_ok, mass_rows), 10):
+            bad_mass.append((mtag, mass_cap[mtag], spec))
     status = "pass"
     details = [f"masters with mass spec={len(mass_spec)}, captured masses={len(mass_cap)}"]
-    if missing_mass:
+    if n_missing_mass:
         status = "fail" if strict else "warn"
-        details.append(f"{len(missing_mass)} master(s) with missing runtime mass")
+        details.append(f"{n_missing_mass} master(s) with missing runtime mass")
     if bad_mass:
         status = "fail" if strict else "warn"
         details.append(f"{len(bad_mass)} master(s) with mass mismatch (sample shown)")
     report["checks"]["master_masses"] = {
         "status": status,
         "details": details,
-        "missing_mass_sample": missing_mass[:10],
-        "mismatch_sample": bad_mass,
+        "missing_mass_sample": missing_mass,
+        "mismatch_sample": [{"node": n, "cap": c, "spec": sp} for n, c, sp in bad_mass],
     }
 
     # --- elements & transforms ---
-    art_pairs = _union_element_pairs(beams_json, cols_json)
-    cap_pairs: Set[Tuple[int, int]] = set()
-    for e in cap["elements"]:
-        try:
-            i = int(e["i"]); j = int(e["j"])
-            a, b = (i, j) if i <= j else (j, i)
-            cap_pairs.add((a, b))
-        except Exception:
-            continue
-    missing_pairs = sorted(list(art_pairs - cap_pairs))
-    extra_pairs = sorted(list(cap_pairs - art_pairs))
+    art_pairs = beam_pairs | col_pairs
+    n_missing_pairs, missing_pairs = _diff_stats(art_pairs, cap_pairs)
+    n_extra_pairs, extra_pairs = _diff_stats(cap_pairs, art_pairs)
 
     status = "pass"
     details = [f"pairs art={len(art_pairs)}, cap={len(cap_pairs)}"]
-    if missing_pairs:
+    if n_missing_pairs:
         status = "fail" if strict else "warn"
-        details.append(f"{len(missing_pairs)} element pair(s) missing in runtime")
-    if extra_pairs:
+        details.append(f"{n_missing_pairs} element pair(s) missing in runtime")
+    if n_extra_pairs:
         status = "warn" if status == "pass" else status
-        details.append(f"{len(extra_pairs)} extra element pair(s) present in runtime")
+        details.append(f"{n_extra_pairs} extra element pair(s) present in runtime")
     report["checks"]["elements"] = {
         "status": status,
         "details": details,
-        "missing_pairs_sample": missing_pairs[:10],
-        "extra_pairs_sample": extra_pairs[:10],
+        "missing_pairs_sample": missing_pairs,
+        "extra_pairs_sample": extra_pairs,
     }
 
-    art_transf = _transf_tags(beams_json, cols_json)
+    art_transf = beam_transf | col_transf
     cap_transf = set(int(t["tag"]) for t in cap["geom_transf"])
-    missing_transf = sorted(list(art_transf - cap_transf))
-    status = "pass" if not missing_transf else ("fail" if strict else "warn")
+    n_missing_transf, missing_transf = _diff_stats(art_transf, cap_transf)
+    status = "pass" if not n_missing_transf else ("fail" if strict else "warn")
     details = [f"art transf={len(art_transf)}, cap transf={len(cap_transf)}"]
-    if missing_transf:
-        details.append(f"missing transf tags: {missing_transf[:10]}")
+    if n_missing_transf:
+        details.append(f"missing transf tags: {missing_transf}")
     report["checks"]["transf_present"] = {"status": status, "details": details}
 
     # Final summary
@@ -436,21 +705,12 @@ def compare_runtime_vs_artifacts(artifacts_dir: str, stage: str = "all", strict:
     worst = max(levels.get(report["checks"][k]["status"], 2) for k in report["checks"])
     summary = ["PASS", "WARN", "FAIL"][worst]
     report["summary"] = summary
+    # Stamp with post-build artifact state so an unchanged rerun can skip the build
+    report["_sig"] = _input_signature(stage, strict, sources, _artifact_stamps(artifacts_dir_str))
 
     # Robust write (handles Windows locks)
-    out_path = os.path.join(artifacts_dir_str, "verify_runtime_report.json")
     final_path = _safe_write_json(out_path, report)
-
-    print("=== Runtime vs Artifacts Verification ===")
-    print(f"Summary: {summary}")
-    print(f"Artifacts dir: {artifacts_dir_str}")
-    print(f"Report: {final_path}")
-    print("\nChecks:")
-    for name, res in report["checks"].items():
-        det = res.get("details", [])
-        if isinstance(det, list):
-            det = "; ".join(det)
-        print(f" - {name}: {res['status']}  ({det})")
+    _print_summary(report, final_path)
 
     return report
 
@@ -461,9 +721,11 @@ def _parse_args():
     p.add_argument("--stage", default="all", choices=["nodes", "columns", "beams", "all"],
                    help="Build stage to verify (default: all)")
     p.add_argument("--strict", action="store_true", help="Treat warnings as failures")
+    p.add_argument("--force", action="store_true",
+                   help="Rebuild and re-verify even if inputs are unchanged since the last report")
     return p.parse_args()
 
 
 if __name__ == "__main__":
     args = _parse_args()
-    compare_runtime_vs_artifacts(args.artifacts, args.stage, args.strict)
+    compare_runtime_vs_artifacts(args.artifacts, args.stage, args.strict, force=args.force)
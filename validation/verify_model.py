@@ -24,23 +24,81 @@ Checks added/updated in this version:
 from __future__ import annotations
 
 import argparse
+import heapq
 import json
 import os
-from typing import Any, Dict, List, Optional, Set, Tuple
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, FrozenSet, List, Optional, Set, Tuple
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Below this many grid nodes the scalar Z check is faster than building arrays
+_NUMPY_MIN_GRID_NODES = 256
+
+# Artifacts read by verify_model, in the order they are unpacked
+_ARTIFACT_FILES: Tuple[str, ...] = (
+    "story_graph.json",
+    "supports.json",
+    "diaphragms.json",
+    "columns.json",
+    "beams.json",
+    "nodes.json",
+)
+
+# Reports from earlier calls, keyed by strict flag plus each artifact's
+# (path, mtime_ns, size); a touched or replaced artifact changes the key
+_REPORT_CACHE: Dict[Tuple[Any, ...], Dict[str, Any]] = {}
+_REPORT_CACHE_MAX = 16
+# Streamlit serves sessions on threads; guards lookups and insertions above
+_REPORT_CACHE_LOCK = threading.Lock()
+
+# Numeric types accepted for point offsets
+_NUMERIC: Tuple[type, ...] = (int, float)
+
+# Section labels that count as "no section" (emitters write plain strings)
+_EMPTY_SECTION: FrozenSet[Optional[str]] = frozenset({None, ""})
+
+# Secondary endpoint key pairs accepted when i_node/j_node are absent
+_FALLBACK_KEYS: Tuple[Tuple[str, str], ...] = (("i", "j"), ("node_i", "node_j"), ("ni", "nj"), ("I", "J"))
 
 
 def _load(path: str) -> Optional[Dict[str, Any]]:
     try:
-        with open(path, "r", encoding="utf-8") as f:
-            return json.load(f)
+        with open(path, "rb") as f:
+            raw = f.read()
+        if ORJSON_AVAILABLE:
+            try:
+                return orjson.loads(raw)
+            except orjson.JSONDecodeError:
+                pass  # e.g. NaN/Infinity written by json.dump; let the stdlib parser decide
+        return json.loads(raw)
     except Exception:
         return None
 
 
 def _save(path: str, data: Dict[str, Any]) -> None:
     os.makedirs(os.path.dirname(path), exist_ok=True)
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2)
+    payload: Optional[bytes] = None
+    if ORJSON_AVAILABLE:
+        try:
+            payload = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+        except orjson.JSONEncodeError:
+            payload = None  # e.g. non-str keys or oversized ints; stdlib handles those
+    if payload is None:
+        payload = json.dumps(data, indent=2).encode("utf-8")
+    with open(path, "wb") as f:
+        f.write(payload)
 
 
 def _story_index_map(story_graph: Dict[str, Any]) -> Tuple[List[str], Dict[str, int]]:
@@ -48,9 +106,10 @@ def _story_index_map(story_graph: Dict[str, Any]) -> Tuple[List[str], Dict[str,
     return names, {name: i for i, name in enumerate(names)}
 
 
-def _active_point_tag_set(story_graph: Dict[str, Any]) -> Set[int]:
+def _active_point_tag_set(story_graph: Dict[str, Any], sidx: Optional[Dict[str, int]] = None) -> Set[int]:
     """Compute all expected grid node tags from active_points using the deterministic rule."""
-    names, sidx = _story_index_map(story_graph)
+    if sidx is None:
+        _, sidx = _story_index_map(story_graph)
     out: Set[int] = set()
     for sname, pts in (story_graph.get("active_points") or {}).items():
         idx = sidx.get(sname)
@@ -63,52 +122,134 @@ def _active_point_tag_set(story_graph: Dict[str, Any]) -> Set[int]:
     return out
 
 
-def _nodes_used_by_elements(elem_json: Dict[str, Any], kind: str) -> Set[int]:
+def _nodes_used_by_elements(recs: List[Dict[str, Any]]) -> Set[int]:
     """
-    Collect endpoint tags used by elements in an artifact blob.
+    Collect endpoint tags used by element records (e.g. beams.json["beams"]).
     Accepts common keys: i_node/j_node, i/j, node_i/node_j, ni/nj.
     """
     used: Set[int] = set()
-    recs = (elem_json or {}).get(kind) or []
     for e in recs:
-        # Primary keys used in beams/columns emitters
-        if isinstance(e.get("i_node"), int):
-            used.add(int(e["i_node"]))
-        if isinstance(e.get("j_node"), int):
-            used.add(int(e["j_node"]))
+        # Primary keys used in beams/columns emitters; when both are present
+        # (always the case for current emitters) the fallbacks are skipped
+        i_tag = e.get("i_node")
+        j_tag = e.get("j_node")
+        if type(i_tag) is int and type(j_tag) is int:
+            used.add(i_tag)
+            used.add(j_tag)
+            continue
+        if type(i_tag) is int:
+            used.add(i_tag)
+        if type(j_tag) is int:
+            used.add(j_tag)
 
         # Secondary fallbacks
-        for ki, kj in (("i", "j"), ("node_i", "node_j"), ("ni", "nj"), ("I", "J")):
-            if ki in e and isinstance(e[ki], int):
-                used.add(int(e[ki]))
-            if kj in e and isinstance(e[kj], int):
-                used.add(int(e[kj]))
+        for ki, kj in _FALLBACK_KEYS:
+            vi = e.get(ki)
+            vj = e.get(kj)
+            if type(vi) is int:
+                used.add(vi)
+            if type(vj) is int:
+                used.add(vj)
     return used
 
 
 def _point_offset(p: Dict[str, Any]) -> float:
     v = p.get("explicit_z")
-    if isinstance(v, (int, float)):
+    if isinstance(v, _NUMERIC):
         return float(v)
     v = p.get("z")
-    if isinstance(v, (int, float)):
+    if isinstance(v, _NUMERIC):
         return float(v)
     return 0.0
 
 
+def _artifact_stamp(path: str) -> Tuple[str, Optional[int], Optional[int]]:
+    try:
+        st = os.stat(path)
+    except OSError:
+        return path, None, None
+    return path, st.st_mtime_ns, st.st_size
+
+
+def _print_summary(report: Dict[str, Any], out_path: str) -> None:
+    print("=== Verification Summary ===")
+    print(f"Summary: {report['summary']}")
+    print(f"Artifacts dir: {report['artifacts_dir']}")
+    print(f"Report: {out_path}")
+    print("\nChecks:")
+    for name, res in report["checks"].items():
+        details = res.get("details") or []
+        if isinstance(details, list):
+            details_str = "; ".join(details)
+        else:
+            details_str = str(details)
+        print(f" - {name}: {res['status']}  ({details_str})")
+
+
 def verify_model(
     artifacts_dir: str = "out",
     *,
     strict: bool = False,
 ) -> Dict[str, Any]:
+    """
+    Run all artifact checks and write <artifacts_dir>/verify_report.json.
+
+    Reports are memoized on the artifacts' mtimes and sizes, so repeated calls
+    on unchanged artifacts return the same (shared) report dict without
+    re-reading them; treat the returned report as read-only.
+    """
     artifacts_dir_str = str(artifacts_dir)
+    out_path = os.path.join(artifacts_dir_str, "verify_report.json")
 
-    sg = _load(os.path.join(artifacts_dir_str, "story_graph.json")) or {}
-    sp = _load(os.path.join(artifacts_dir_str, "supports.json")) or {}
-    dg = _load(os.path.join(artifacts_dir_str, "diaphragms.json")) or {}
-    cj = _load(os.path.join(artifacts_dir_str, "columns.json")) or {}
-    bj = _load(os.path.join(artifacts_dir_str, "beams.json")) or {}
-    nj = _load(os.path.join(artifacts_dir_str, "nodes.json")) or {}
+    paths = [os.path.join(artifacts_dir_str, name) for name in _ARTIFACT_FILES]
+    cache_key = (strict,) + tuple(_artifact_stamp(p) for p in paths)
+    with _REPORT_CACHE_LOCK:
+        cached = _REPORT_CACHE.get(cache_key)
+    if cached is not None:
+        # The file on disk may hold a report for the other strict setting
+        _save(out_path, cached)
+        _print_summary(cached, out_path)
+        return cached
+
+    # The artifacts are independent, so read and parse them concurrently
+    with ThreadPoolExecutor(max_workers=len(paths)) as ex:
+        sg, sp, dg, cj, bj, nj = [blob or {} for blob in ex.map(_load, paths)]
+
+    # Record lists, bound once for every check below
+    cols: List[Dict[str, Any]] = cj.get("columns") or []
+    beams: List[Dict[str, Any]] = bj.get("beams") or []
+    nodes_list: List[Dict[str, Any]] = nj.get("nodes") or []
+    diaphs: List[Dict[str, Any]] = dg.get("diaphragms") or []
+    applied = sp.get("applied") or []
+
+    # Single pass over nodes.json; the checks below reuse these structures
+    node_tags: List[int] = []
+    grid_nodes: List[Dict[str, Any]] = []
+    interface_tags: Set[int] = set()
+    kind_counts: Dict[str, int] = {}
+    for n in nodes_list:
+        tag = int(n.get("tag"))
+        kind = str(n.get("kind", ""))
+        node_tags.append(tag)
+        kind_counts[kind] = kind_counts.get(kind, 0) + 1
+        if kind == "grid":
+            grid_nodes.append(n)
+        elif kind == "rigid_interface":
+            interface_tags.add(tag)
+
+    # Story order and index, derived once from story_graph.json
+    names, sidx = _story_index_map(sg)
+
+    # Tag sets shared by nodes_presence, endpoints_exist and orphans, built once
+    have_nodes: FrozenSet[int] = frozenset(node_tags)
+    expected_grid: FrozenSet[int] = frozenset(_active_point_tag_set(sg, sidx)) if sg else frozenset()
+    masters_in_dg: FrozenSet[int] = (
+        frozenset(int(rec.get("master")) for rec in diaphs) if dg else frozenset()
+    )
+
+    # Support tags and their story indices, shared by base_supports and rigid_diaphragms
+    applied_tags: List[int] = [int(r.get("node", -1)) for r in applied] if isinstance(applied, list) else []
+    applied_idx: List[int] = [t % 1000 for t in applied_tags]
 
     report: Dict[str, Any] = {
         "artifacts_dir": artifacts_dir_str,
@@ -126,14 +267,21 @@ def verify_model(
     # --- story_elev_order ---
     elev_order = {"status": "pass", "details": []}
     if sg:
-        names, _ = _story_index_map(sg)
         elev = sg.get("story_elev") or {}
-        vals = [float(elev.get(n, 0.0)) for n in names]
-        ok = all(vals[i] >= vals[i + 1] - 1e-9 for i in range(len(vals) - 1))
+        # Stop at the first story that rises above the one before it
+        ok = True
+        prev: Optional[float] = None
+        for n in names:
+            v = float(elev.get(n, 0.0))
+            if prev is not None and not prev >= v - 1e-9:
+                ok = False
+                break
+            prev = v
         if not ok:
             elev_order["status"] = "fail" if strict else "warn"
             elev_order["details"].append("story_elev not monotone from top to bottom")
-            elev_order["sequence"] = [{"story": n, "elev": v} for n, v in zip(names, vals)]
+            # Full sequence is only materialized for the report on failure
+            elev_order["sequence"] = [{"story": n, "elev": float(elev.get(n, 0.0))} for n in names]
         else:
             elev_order["details"].append("story_elev monotone (top->bottom)")
     else:
@@ -144,16 +292,11 @@ def verify_model(
     # --- base_supports ---
     check_base_supports = {"status": "warn", "details": ""}
     if sp and sg:
-        names, sidx = _story_index_map(sg)
         base_name = names[-1] if names else None
         base_idx = sidx.get(base_name) if base_name else None
-        applied = sp.get("applied") or []
-        base_nodes = []
-        if isinstance(applied, list) and base_idx is not None:
-            for rec in applied:
-                tag = int(rec.get("node", -1))
-                if tag % 1000 == base_idx:
-                    base_nodes.append(tag)
+        base_nodes: List[int] = []
+        if base_idx is not None:
+            base_nodes = [t for t, i in zip(applied_tags, applied_idx) if i == base_idx]
         if base_nodes:
             check_base_supports.update({"status": "pass", "details": f"{len(base_nodes)} base support nodes detected"})
         else:
@@ -165,17 +308,9 @@ def verify_model(
     # --- rigid_diaphragms ---
     check_rigid = {"status": "pass", "details": [], "violations": []}
     if dg and sg:
-        names, sidx = _story_index_map(sg)
-        stories_with_supports: Set[str] = set()
-        if sp:
-            applied = sp.get("applied") or []
-            for rec in applied:
-                tag = int(rec.get("node", -1))
-                idx = tag % 1000
-                if 0 <= idx < len(names):
-                    stories_with_supports.add(names[idx])
-
-        for rec in dg.get("diaphragms", []):
+        stories_with_supports: Set[str] = {names[i] for i in applied_idx if 0 <= i < len(names)}
+
+        for rec in diaphs:
             sname = rec.get("story")
             slaves = rec.get("slaves", [])
             mass = rec.get("mass", {})
@@ -199,28 +334,23 @@ def verify_model(
 
     # --- nodes_presence ---
     nodes_check = {"status": "warn", "details": []}
-    expected_grid = _active_point_tag_set(sg) if sg else set()
-    have_nodes = {int(n.get("tag")) for n in (nj.get("nodes") or [])} if nj else set()
-    kinds_by_tag = {int(n.get("tag")): str(n.get("kind", "")) for n in (nj.get("nodes") or [])} if nj else {}
-    masters_in_dg = {int(rec.get("master")) for rec in (dg.get("diaphragms") or [])} if dg else set()
-    interface_tags = {t for t, k in kinds_by_tag.items() if k == "rigid_interface"}
 
     if nj:
-        missing_grid = sorted(list(expected_grid - have_nodes))
+        missing_grid = expected_grid - have_nodes
         # Do not count registered interface nodes as "extra"
-        extra_nodes = sorted(list((have_nodes - expected_grid - masters_in_dg) - interface_tags))
-        total = len(nj.get("nodes") or [])
-        grid_count = sum(1 for n in (nj.get("nodes") or []) if n.get("kind") == "grid")
-        master_count = sum(1 for n in (nj.get("nodes") or []) if n.get("kind") == "diaphragm_master")
+        extra_nodes = (have_nodes - expected_grid - masters_in_dg) - interface_tags
+        total = len(nodes_list)
+        grid_count = kind_counts.get("grid", 0)
+        master_count = kind_counts.get("diaphragm_master", 0)
         nodes_check["details"].append(f"total={total}, grid={grid_count}, master={master_count}")
         if missing_grid:
             nodes_check["status"] = "fail" if strict else "warn"
             nodes_check["details"].append(f"{len(missing_grid)} expected grid node(s) missing from nodes.json")
-            nodes_check["missing_grid_sample"] = missing_grid[:10]
+            nodes_check["missing_grid_sample"] = heapq.nsmallest(10, missing_grid)
         if extra_nodes:
             # informational
             nodes_check["details"].append(f"{len(extra_nodes)} extra node(s) (not grid/master); sample shown")
-            nodes_check["extra_nodes_sample"] = extra_nodes[:10]
+            nodes_check["extra_nodes_sample"] = heapq.nsmallest(10, extra_nodes)
         if not missing_grid and not extra_nodes:
             nodes_check["status"] = "pass"
     else:
@@ -231,38 +361,69 @@ def verify_model(
     # --- node_z_consistency ---
     zcheck = {"status": "pass", "details": [], "mismatches": []}
     if nj and sg:
-        names, sidx = _story_index_map(sg)
         elev_by_story: Dict[str, float] = sg.get("story_elev") or {}
         ap: Dict[str, List[Dict[str, Any]]] = sg.get("active_points") or {}
-        offset_map: Dict[Tuple[str, str], float] = {}
+        # Point offsets keyed story -> point id, so each lookup hashes plain strings
+        offset_by_story: Dict[str, Dict[str, float]] = {}
+        no_offsets: Dict[str, float] = {}
         for sname, pts in ap.items():
+            d = offset_by_story.setdefault(sname, {})
             for p in pts:
                 pid_raw = p.get("id", p.get("tag"))
                 pid_str = str(pid_raw) if pid_raw is not None else ""
                 if pid_str:
                     v = p.get("explicit_z")
-                    if isinstance(v, (int, float)):
-                        offset_map[(sname, pid_str)] = float(v)
+                    if isinstance(v, _NUMERIC):
+                        d[pid_str] = float(v)
                     else:
                         v2 = p.get("z")
-                        offset_map[(sname, pid_str)] = float(v2) if isinstance(v2, (int, float)) else 0.0
+                        d[pid_str] = float(v2) if isinstance(v2, _NUMERIC) else 0.0
 
         mismatches = 0
         sample: List[Dict[str, Any]] = []
-        for n in nj.get("nodes", []):
-            if n.get("kind") != "grid":
-                continue
-            sname = n.get("story")
-            pid = n.get("source_point_id")
-            if sname is None or pid is None:
-                continue
-            z_expected = float(elev_by_story.get(sname, 0.0)) - float(offset_map.get((sname, pid), 0.0))
-            z_actual = float(n.get("z", 0.0))
-            if abs(z_actual - z_expected) > 1e-6:
-                mismatches += 1
-                if len(sample) < 10:
-                    sample.append({"tag": n.get("tag"), "story": sname, "pid": pid,
-                                   "z_actual": z_actual, "z_expected": z_expected})
+        if NUMPY_AVAILABLE and len(grid_nodes) >= _NUMPY_MIN_GRID_NODES:
+            keyed = [n for n in grid_nodes
+                     if n.get("story") is not None and n.get("source_point_id") is not None]
+            count = len(keyed)
+            z_act = np.fromiter((float(n.get("z", 0.0)) for n in keyed), dtype=np.float64, count=count)
+            z_exp = np.fromiter(
+                (float(elev_by_story.get(n["story"], 0.0))
+                 - float(offset_by_story.get(n["story"], no_offsets).get(n["source_point_id"], 0.0))
+                 for n in keyed),
+                dtype=np.float64,
+                count=count,
+            )
+            mask = np.abs(z_act - z_exp) > 1e-6
+            mismatches = int(mask.sum())
+            for i in np.flatnonzero(mask)[:10].tolist():
+                n = keyed[i]
+                sample.append({"tag": n.get("tag"), "story": n["story"], "pid": n["source_point_id"],
+                               "z_actual": float(z_act[i]), "z_expected": float(z_exp[i])})
+        else:
+            # Mismatching nodes with their Z values; the sample is sliced off afterwards
+            bad_z: List[Tuple[Dict[str, Any], float, float]] = []
+            for n in grid_nodes:
+                sname = n.get("story")
+                pid = n.get("source_point_id")
+                if sname is None or pid is None:
+                    continue
+                # Stories and points are almost always present, so index directly
+                try:
+                    elev = elev_by_story[sname]
+                except KeyError:
+                    elev = 0.0
+                try:
+                    offset = offset_by_story[sname][pid]
+                except KeyError:
+                    offset = 0.0
+                z_expected = float(elev) - float(offset)
+                z_actual = float(n.get("z", 0.0))
+                if abs(z_actual - z_expected) > 1e-6:
+                    bad_z.append((n, z_actual, z_expected))
+            mismatches = len(bad_z)
+            sample = [{"tag": n.get("tag"), "story": n["story"], "pid": n["source_point_id"],
+                       "z_actual": z_actual, "z_expected": z_expected}
+                      for n, z_actual, z_expected in bad_z[:10]]
         if mismatches:
             zcheck["status"] = "fail" if strict else "warn"
             zcheck["details"].append(f"{mismatches} grid node(s) with Z mismatch vs story_elev - offset")
@@ -276,8 +437,8 @@ def verify_model(
 
     # --- elements_presence & transforms_sections ---
     checks_elements = {"status": "pass", "details": []}
-    col_count = len((cj or {}).get("columns") or [])
-    beam_count = len((bj or {}).get("beams") or [])
+    col_count = len(cols)
+    beam_count = len(beams)
     if col_count == 0 and beam_count == 0:
         checks_elements["status"] = "fail"
         checks_elements["details"].append("No columns or beams created")
@@ -289,12 +450,12 @@ def verify_model(
     missing_transf = 0
     missing_section = 0
     total = 0
-    for k, blob in (("columns", cj), ("beams", bj)):
-        for e in (blob or {}).get(k, []) or []:
+    for recs in (cols, beams):
+        for e in recs:
             total += 1
             if e.get("transf_tag") is None:
                 missing_transf += 1
-            if e.get("section", None) in (None, ""):
+            if e.get("section") in _EMPTY_SECTION:
                 missing_section += 1
     sec_rate = (missing_section / total) if total else 1.0
     if missing_transf:
@@ -310,32 +471,38 @@ def verify_model(
     # --- endpoints_exist (NEW) ---
     endpoints_check = {"status": "pass", "details": []}
     if nj:
-        have_nodes = {int(n.get("tag")) for n in (nj.get("nodes") or [])}
         missing: List[Dict[str, Any]] = []
+        has_node = have_nodes.__contains__
 
-        def _scan(label: str, blob: Dict[str, Any]) -> None:
-            recs = (blob or {}).get(label) or []
+        def _scan(label: str, recs: List[Dict[str, Any]]) -> int:
+            """Count elements with absent endpoints; only the first 10 are kept as samples."""
+            count = 0
             for idx, e in enumerate(recs, start=1):
                 i_tag = e.get("i_node")
                 j_tag = e.get("j_node")
-                if not isinstance(i_tag, int) or not isinstance(j_tag, int):
+                if isinstance(i_tag, int) and isinstance(j_tag, int):
+                    pass
+                else:
                     # Try fallbacks
-                    for ki, kj in (("i", "j"), ("node_i", "node_j"), ("ni", "nj"), ("I", "J")):
+                    for ki, kj in _FALLBACK_KEYS:
                         if ki in e and kj in e and isinstance(e[ki], int) and isinstance(e[kj], int):
                             i_tag, j_tag = int(e[ki]), int(e[kj])
                             break
-                if isinstance(i_tag, int) and isinstance(j_tag, int):
-                    bad = [t for t in (i_tag, j_tag) if t not in have_nodes]
-                    if bad:
+                    else:
+                        continue
+                if not has_node(i_tag) or not has_node(j_tag):
+                    count += 1
+                    if len(missing) < 10:
+                        bad = [t for t in (i_tag, j_tag) if not has_node(t)]
                         missing.append({"index": idx, "kind": label, "missing": bad})
+            return count
 
-        _scan("beams", bj)
-        _scan("columns", cj)
+        missing_count = _scan("beams", beams) + _scan("columns", cols)
 
-        if missing:
+        if missing_count:
             endpoints_check["status"] = "fail"
-            endpoints_check["details"].append(f"{len(missing)} element(s) reference node(s) absent from nodes.json")
-            endpoints_check["sample"] = missing[:10]
+            endpoints_check["details"].append(f"{missing_count} element(s) reference node(s) absent from nodes.json")
+            endpoints_check["sample"] = missing
         else:
             endpoints_check["details"].append("All element endpoints exist in nodes.json")
     else:
@@ -345,15 +512,13 @@ def verify_model(
 
     # --- orphans (updated to ignore registered interface nodes) ---
     checks_orphans = {"status": "pass", "details": []}
-    expected_nodes = _active_point_tag_set(sg)
-    used_nodes = _nodes_used_by_elements(cj, "columns") | _nodes_used_by_elements(bj, "beams")
-    have_nodes = {int(n.get("tag")) for n in (nj.get("nodes") or [])} if nj else set()
+    used_nodes = frozenset(_nodes_used_by_elements(cols) | _nodes_used_by_elements(beams))
     # Only consider as orphan those used nodes that are neither in story_graph nor in nodes.json
-    missing = sorted((used_nodes - expected_nodes) - have_nodes)
+    missing = (used_nodes - expected_grid) - have_nodes
     if missing:
         checks_orphans["status"] = "warn" if not strict else "fail"
         checks_orphans["details"].append(f"{len(missing)} element node(s) not in story_graph or nodes.json")
-        checks_orphans["missing_nodes_sample"] = missing[:10]
+        checks_orphans["missing_nodes_sample"] = heapq.nsmallest(10, missing)
     else:
         checks_orphans["details"].append("No orphan element nodes detected")
     report["checks"]["orphans"] = checks_orphans
@@ -366,22 +531,13 @@ def verify_model(
     summary = ["PASS", "WARN", "FAIL"][worst]
     report["summary"] = summary
 
-    out_path = os.path.join(artifacts_dir_str, "verify_report.json")
     _save(out_path, report)
+    _print_summary(report, out_path)
 
-    print("=== Verification Summary ===")
-    print(f"Summary: {summary}")
-    print(f"Artifacts dir: {artifacts_dir_str}")
-    print(f"Report: {out_path}")
-    print("\nChecks:")
-    for name, res in report["checks"].items():
-        details = res.get("details") or []
-        if isinstance(details, list):
-            details_str = "; ".join(details)
-        else:
-            details_str = str(details)
-        print(f" - {name}: {res['status']}  ({details_str})")
-
+    with _REPORT_CACHE_LOCK:
+        if cache_key not in _REPORT_CACHE and len(_REPORT_CACHE) >= _REPORT_CACHE_MAX:
+            _REPORT_CACHE.pop(next(iter(_REPORT_CACHE)))
+        _REPORT_CACHE[cache_key] = report
     return report
 
 